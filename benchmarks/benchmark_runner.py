@@ -1,5 +1,5 @@
 import os
-from .stats_collector import run_solver_on_folder
+from .stats_collector import run_solver_on_folders
 from .graph_generator import generate_graphs
 
 
@@ -8,6 +8,7 @@ SOLVERS = {
     'dp': 'solver.sat_dp.dp_algorithm',
     'dpll': 'solver.sat_dpll.dpll',
     'resolution': 'solver.sat_resolution.resolution_algorithm',
+    'cdcl': 'solver.sat_cdcl.cdcl',
 }
 
 RESULTS_PATH = 'results/benchmark_stats.json'
@@ -17,14 +18,10 @@ def main():
 
     for solver_name, solver_path in SOLVERS.items():
         print(f"\n🔍 Benchmarking {solver_name.upper()}...")
-        solver_stats = {}
-        for folder_name in os.listdir(CNF_ROOT):
-            folder_path = os.path.join(CNF_ROOT, folder_name)
-            if not os.path.isdir(folder_path):
-                continue
-            print(f"\n📁 Folder: {folder_name}")
-            stats = run_solver_on_folder(solver_path, folder_path)
-            solver_stats[folder_name] = stats
+        folders = [name for name in os.listdir(CNF_ROOT) if os.path.isdir(os.path.join(CNF_ROOT, name))]
+        print(f"\n📁 Folders: {', '.join(folders)}")
+        stats = run_solver_on_folders(solver_path, [os.path.join(CNF_ROOT, name) for name in folders])
+        solver_stats = {name: stats[os.path.join(CNF_ROOT, name)] for name in folders}
         all_stats[solver_name] = solver_stats
 
     # Save and generate graphs
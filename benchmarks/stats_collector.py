@@ -1,36 +1,41 @@
 import os
-import time
 import importlib
-import multiprocessing
 from collections import defaultdict
 from itertools import combinations
 
-def run_solver_on_folder(solver_path, folder_path, timeout=10):
+def run_solver_on_folder(solver_path, folder_path, timeout=10, workers=None):
+    return run_solver_on_folders(solver_path, [folder_path], timeout, workers)[folder_path]
+
+def run_solver_on_folders(solver_path, folder_paths, timeout=10, workers=None):
+    """Runs one solver over several folders on a shared set of workers.
+
+    Returns {folder_path: stats}; stats['times'] holds wall and
+    stats['cpu_times'] CPU seconds of each solved file.
+    """
+    from solver.sat_pool import Scheduler, cnf_tasks
     module_name, func_name = solver_path.rsplit('.', 1)
     solver_module = importlib.import_module(module_name)
     solver_func = getattr(solver_module, func_name)
 
-    stats = {'solved': 0, 'timeout': 0, 'total': 0, 'times': []}
+    all_stats = {path: {'solved': 0, 'timeout': 0, 'total': 0, 'times': [], 'cpu_times': []}
+                 for path in folder_paths}
+    tasks = ((folder_path, solver_func, load_clauses(os.path.join(folder_path, filename)), timeout)
+             for folder_path, filename in cnf_tasks(folder_paths))
 
-    for filename in os.listdir(folder_path):
-        if not filename.endswith('.cnf'):
-            continue
-        file_path = os.path.join(folder_path, filename)
-        start = time.time()
-        try:
-            with multiprocessing.get_context("spawn").Pool(1) as pool:
-                result = pool.apply_async(solver_func, (load_clauses(file_path),))
-                is_sat = result.get(timeout=timeout)
-            elapsed = time.time() - start
-            stats['solved'] += 1
-            stats['times'].append(elapsed)
-        except multiprocessing.TimeoutError:
-            stats['timeout'] += 1
-        stats['total'] += 1
+    with Scheduler(workers) as scheduler:
+        for folder_path, _, wall, cpu, status in scheduler.run(tasks):
+            stats = all_stats[folder_path]
+            if status == 'timeout':
+                stats['timeout'] += 1
+            elif status is None:
+                stats['solved'] += 1
+                stats['times'].append(wall)
+                stats['cpu_times'].append(cpu)
+            stats['total'] += 1
 
-    return stats
+    return all_stats
 
 def load_clauses(file_path):
-    from solver.sat_reader import read_dimacs_cnf
-    _, _, raw_clauses = read_dimacs_cnf(file_path)
-    return [frozenset(clause) for clause in raw_clauses]
+    from solver.sat_cache import read_dimacs_cached
+    _, _, clauses = read_dimacs_cached(file_path)
+    return clauses
@@ -0,0 +1,45 @@
+import json
+from functools import partial
+from sat_cdcl import cdcl_with_stats
+from sat_pool import benchmark_folders, benchmark_subfolders
+
+def count_deleted(result):
+    _, stats = result
+    return stats['deleted_clauses']
+
+def benchmark_folder(folder_path, timeout=10, max_files=None, restarts='glucose', phase_saving=True, workers=None):
+    """
+    Benchmarks up to `max_files` .cnf files in `folder_path` on `workers`
+    processes (one per core by default).
+    If max_files is None, benchmarks all files.
+    Returns a dict with files_processed, timeouts, avg_time, avg_cpu_time and clauses_deleted.
+    """
+    solver = partial(cdcl_with_stats, restarts=restarts, phase_saving=phase_saving)
+    return benchmark_folders(solver, [folder_path], timeout, max_files, workers, counters={"clauses_deleted": count_deleted})[folder_path]
+
+def benchmark_all_folders(base_path, timeout=20, max_files_per_folder=20, restarts='glucose',
+                          phase_saving=True, output_path="benchmark_cdcl.json", workers=None):
+    """
+    Benchmarks each sub-folder of base_path, taking at most
+    `max_files_per_folder` CNF files from each, with the given CDCL restart
+    policy ('luby', 'geometric', 'glucose' or None) and phase saving setting.
+    Saves aggregated results to `output_path`.
+    """
+    solver = partial(cdcl_with_stats, restarts=restarts, phase_saving=phase_saving)
+    results = benchmark_subfolders(solver, base_path, timeout, max_files_per_folder, workers, counters={"clauses_deleted": count_deleted})
+
+    with open(output_path, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✅ All benchmark results saved to {output_path}")
+
+if __name__ == "__main__":
+    # Adjust these parameters as needed
+    base_path = 'C:\\Users\\andre\\SAT-Solver\\cnfs\\50-250'
+    timeout_seconds = 60
+    max_files_per_folder = 10  # e.g., set to 20 to limit per-folder files
+    restarts = 'glucose'  # 'luby', 'geometric', 'glucose' or None
+    phase_saving = True
+
+    benchmark_all_folders(base_path, timeout=timeout_seconds, max_files_per_folder=max_files_per_folder,
+                          restarts=restarts, phase_saving=phase_saving,
+                          output_path=f"benchmark_cdcl_{restarts}.json")
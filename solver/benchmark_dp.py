@@ -1,63 +1,59 @@
 import os
-import time
-import multiprocessing
-from sat_reader import read_dimacs_cnf
-from sat_dp import dp_algorithm
+from sat_reader import is_cnf_file
+from sat_cache import read_dimacs_cached
+from sat_dp import dp_with_stats
 import json
-
-def run_dp_with_timeout(clauses, timeout=60):
-    with multiprocessing.get_context("spawn").Pool(1) as pool:
-        result = pool.apply_async(dp_algorithm, (clauses,))
-        try:
-            is_sat = result.get(timeout=timeout)
-            return is_sat, None
-        except multiprocessing.TimeoutError:
-            pool.terminate()
-            pool.join()
-            return None, 'timeout'
+from sat_pool import SolverPool
 
 def benchmark_dp_folder(folder_path, timeout=60):
     print(f"\n🚀 Benchmarking DP on folder: {os.path.basename(folder_path)}\n")
     total_time = 0
     timed_out = 0
     file_count = 0
+    subsumed = 0
 
+    pool = SolverPool()  # one warm worker for the whole folder
     for filename in os.listdir(folder_path):
-        if not filename.endswith('.cnf'):
+        if not is_cnf_file(filename):
             continue
 
         file_path = os.path.join(folder_path, filename)
         print(f"🧩 File: {filename}")
         try:
-            _, _, raw_clauses = read_dimacs_cnf(file_path)
-            clauses = [frozenset(clause) for clause in raw_clauses]
+            _, _, clauses = read_dimacs_cached(file_path)
 
-            start_time = time.time()
-            result, status = run_dp_with_timeout(clauses, timeout=timeout)
-            elapsed = time.time() - start_time
+            with clauses:
+                result, elapsed, status = pool.run(dp_with_stats, clauses, timeout)
 
             if status == 'timeout':
                 print(f"⏱️ Timeout (> {timeout}s)")
                 timed_out += 1
             else:
-                print(f"✅ Result: {'SAT' if result else 'UNSAT'} — {elapsed:.2f}s")
+                is_sat, pruned = result
+                print(f"✅ Result: {'SAT' if is_sat else 'UNSAT'} — {elapsed:.2f}s "
+                      f"({pruned['forward_subsumed']} forward / {pruned['backward_subsumed']} backward subsumed)")
                 total_time += elapsed
+                subsumed += pruned['forward_subsumed'] + pruned['backward_subsumed']
 
             file_count += 1
 
         except Exception as e:
             print(f"❌ Error: {e}")
 
+    pool.close()
+
     print("\n📊 Benchmark Summary:")
     print(f"  → Files processed: {file_count}")
     print(f"  → Timeouts: {timed_out}")
     print(f"  → Total time (non-timeout): {total_time:.2f}s")
+    print(f"  → Clauses subsumed: {subsumed}")
     print(f"  → Avg time per file: {total_time/(file_count - timed_out):.2f}s" if (file_count - timed_out) else "  → All files timed out.")
 
     stats = {
         "files_processed": file_count,
         "timeouts": timed_out,
-        "avg_time": total_time / (file_count - timed_out) if (file_count - timed_out) else 0
+        "avg_time": total_time / (file_count - timed_out) if (file_count - timed_out) else 0,
+        "clauses_subsumed": subsumed
     }
     with open("benchmark_stats_dp.json", "w") as f:
         json.dump(stats, f)
@@ -1,20 +1,9 @@
 import os
-import time
-import multiprocessing
-from sat_reader import read_dimacs_cnf
+from sat_reader import is_cnf_file
+from sat_cache import read_dimacs_cached
 from sat_dpll import dpll
 import json
-
-def run_dpll_with_timeout(clauses, timeout=10):
-    with multiprocessing.get_context("spawn").Pool(1) as pool:
-        result = pool.apply_async(dpll, (clauses,))
-        try:
-            is_sat = result.get(timeout=timeout)
-            return is_sat, None
-        except multiprocessing.TimeoutError:
-            pool.terminate()
-            pool.join()
-            return None, 'timeout'
+from sat_pool import SolverPool
 
 def benchmark_dpll_folder(folder_path, timeout=10):
     print(f"\n🚀 Benchmarking DPLL on folder: {os.path.basename(folder_path)}\n")
@@ -22,19 +11,18 @@ def benchmark_dpll_folder(folder_path, timeout=10):
     timed_out = 0
     file_count = 0
 
+    pool = SolverPool()  # one warm worker for the whole folder
     for filename in os.listdir(folder_path):
-        if not filename.endswith('.cnf'):
+        if not is_cnf_file(filename):
             continue
 
         file_path = os.path.join(folder_path, filename)
         print(f"🧩 File: {filename}")
         try:
-            _, _, raw_clauses = read_dimacs_cnf(file_path)
-            clauses = [frozenset(clause) for clause in raw_clauses]
+            _, _, clauses = read_dimacs_cached(file_path)
 
-            start_time = time.time()
-            result, status = run_dpll_with_timeout(clauses, timeout=timeout)
-            elapsed = time.time() - start_time
+            with clauses:
+                result, elapsed, status = pool.run(dpll, clauses, timeout)
 
             if status == 'timeout':
                 print(f"⏱️ Timeout (> {timeout}s)")
@@ -48,6 +36,8 @@ def benchmark_dpll_folder(folder_path, timeout=10):
         except Exception as e:
             print(f"❌ Error: {e}")
 
+    pool.close()
+
     print("\n📊 Benchmark Summary:")
     print(f"  → Files processed: {file_count}")
     print(f"  → Timeouts: {timed_out}")
@@ -0,0 +1,38 @@
+import json
+from sat_dpll_vsids import dpll_vsids
+from sat_preprocess import with_preprocessing
+from sat_pool import benchmark_folders, benchmark_subfolders
+
+def benchmark_folder(folder_path, timeout=10, max_files=None, workers=None, preprocess=False):
+    """
+    Benchmarks up to `max_files` .cnf files in `folder_path` on `workers`
+    processes (one per core by default).
+    If max_files is None, benchmarks all files. With preprocess=True the
+    solver runs on the BVE-simplified formula.
+    Returns a dict with files_processed, timeouts, avg_time and avg_cpu_time.
+    """
+    solver = with_preprocessing(dpll_vsids) if preprocess else dpll_vsids
+    return benchmark_folders(solver, [folder_path], timeout, max_files, workers)[folder_path]
+
+def benchmark_all_folders(base_path, timeout=20, max_files_per_folder=20, workers=None, preprocess=False):
+    """
+    Benchmarks each sub-folder of base_path, taking at most
+    `max_files_per_folder` CNF files from each.
+    Saves aggregated results to 'benchmark_vsids.json',
+    or 'benchmark_vsids_bve.json' with preprocess=True.
+    """
+    solver = with_preprocessing(dpll_vsids) if preprocess else dpll_vsids
+    results = benchmark_subfolders(solver, base_path, timeout, max_files_per_folder, workers)
+
+    output = "benchmark_vsids_bve.json" if preprocess else "benchmark_vsids.json"
+    with open(output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n✅ All benchmark results saved to {output}")
+
+if __name__ == "__main__":
+    # Adjust these parameters as needed
+    base_path = 'C:\\Users\\andre\\SAT-Solver\\cnfs\\50-250'
+    timeout_seconds = 60
+    max_files_per_folder = 10  # e.g., set to 20 to limit per-folder files
+
+    benchmark_all_folders(base_path, timeout=timeout_seconds, max_files_per_folder=max_files_per_folder)
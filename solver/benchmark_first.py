@@ -1,47 +1,42 @@
 import os
-import time
+import sys
 import json
-import multiprocessing
-from sat_reader import read_dimacs_cnf
+from sat_reader import is_cnf_file
+from sat_cache import read_dimacs_cached
 from sat_dpll import dpll
 from sat_dp import dp_algorithm
 from sat_resolution import resolution_algorithm
+from sat_cdcl import cdcl
+from sat_preprocess import with_preprocessing
+from sat_pool import SolverPool
+from sat_results import ResultCache
 
 ALGORITHMS = {
     'DPLL': dpll,
     'DP': dp_algorithm,
-    'Resolution': resolution_algorithm
+    'Resolution': resolution_algorithm,
+    'CDCL': cdcl,
+    'DPLL+BVE': with_preprocessing(dpll),
+    'CDCL+BVE': with_preprocessing(cdcl)
 }
 
-def run_solver_with_timeout(solver_func, clauses, timeout=10):
-    with multiprocessing.get_context("spawn").Pool(1) as pool:
-        result = pool.apply_async(solver_func, (clauses,))
-        try:
-            output = result.get(timeout=timeout)
-            return output, None
-        except multiprocessing.TimeoutError:
-            pool.terminate()
-            pool.join()
-            return None, 'timeout'
-
-def benchmark_solver(solver_name, solver_func, folder_path, timeout=10):
+def benchmark_solver(solver_name, solver_func, folder_path, timeout=10, cache=None):
     print(f"\n🚀 Benchmarking {solver_name} on folder: {os.path.basename(folder_path)}\n")
     results = []
 
+    pool = SolverPool(cache)  # one warm worker for the whole folder
     for filename in os.listdir(folder_path):
-        if not filename.endswith('.cnf'):
+        if not is_cnf_file(filename):
             continue
 
         file_path = os.path.join(folder_path, filename)
         print(f"🧩 File: {filename}")
 
         try:
-            num_vars, _, raw_clauses = read_dimacs_cnf(file_path)
-            clauses = [frozenset(clause) for clause in raw_clauses]
+            num_vars, _, clauses = read_dimacs_cached(file_path)
 
-            start_time = time.time()
-            result, status = run_solver_with_timeout(solver_func, clauses, timeout=timeout)
-            elapsed = time.time() - start_time
+            with clauses:
+                result, elapsed, status = pool.run(solver_func, clauses, timeout)
 
             result_entry = {
                 "file": filename,
@@ -63,15 +58,18 @@ def benchmark_solver(solver_name, solver_func, folder_path, timeout=10):
         except Exception as e:
             print(f"❌ Error on {filename}: {e}")
 
+    pool.close()
+
     return results
 
 def main():
     folder_path = r'C:\Users\andre\SAT-Solver\cnfs\realtest'
     timeout = 60  # seconds
     all_results = {}
+    cache = None if '--no-cache' in sys.argv else ResultCache()
 
     for name, func in ALGORITHMS.items():
-        all_results[name] = benchmark_solver(name, func, folder_path, timeout)
+        all_results[name] = benchmark_solver(name, func, folder_path, timeout, cache)
 
     with open("benchmark_results.json", "w") as f:
         json.dump(all_results, f, indent=2)
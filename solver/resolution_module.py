@@ -1,27 +1,143 @@
-from itertools import combinations
+import heapq
+from collections import defaultdict
+
+
+def clause_to_mask(clause):
+    """Encodes a clause as (positive, negative) bitmasks with bit v for variable v."""
+    pos = neg = 0
+    for lit in clause:
+        if lit > 0:
+            pos |= 1 << lit
+        else:
+            neg |= 1 << -lit
+    return pos, neg
+
 
 def resolve(ci, cj):
-    resolvents = []
-    for lit in ci:
-        if -lit in cj:
-            new_clause = (ci | cj) - {lit, -lit}
-            if any(-x in new_clause for x in new_clause):
-                continue  # Tautology
-            resolvents.append(frozenset(new_clause))
-    return resolvents
-
-def resolution_algorithm(clauses):
-    clauses = set(clauses)
-    while True:
-        new_resolvents = set()
-        for ci, cj in combinations(clauses, 2):
-            if any(lit in ci and -lit in cj for lit in ci):
-                resolvents = resolve(ci, cj)
-                for r in resolvents:
-                    if not r:
-                        return False  # Empty clause → UNSAT
-                    if r not in clauses and r not in new_resolvents:
-                        new_resolvents.add(r)
-        if not new_resolvents:
-            return True  # No new resolvents → SAT
-        clauses |= new_resolvents
+    """Resolvent of two mask-encoded clauses, or None.
+
+    Two clauses clashing on more than one variable only have tautological
+    resolvents, so there is something to return only when the clash is a
+    single bit.
+    """
+    pi, ni = ci
+    pj, nj = cj
+    clash = (pi & nj) | (ni & pj)
+    if not clash or clash & (clash - 1):
+        return None
+    keep = ~clash
+    return (pi | pj) & keep, (ni | nj) & keep
+
+
+def mask_literals(mask):
+    pos, neg = mask
+    literals = []
+    for sign, bits in ((1, pos), (-1, neg)):
+        while bits:
+            low = bits & -bits
+            literals.append(sign * (low.bit_length() - 1))
+            bits ^= low
+    return literals
+
+
+def subsumes(a, b):
+    """True if mask-encoded clause a is a subset of clause b."""
+    return not (a[0] & ~b[0]) and not (a[1] & ~b[1])
+
+
+def resolution_algorithm(clauses, verbose=False, stats=None):
+    """Given-clause saturation: SAT iff no empty clause is derivable.
+
+    Clauses wait in `unprocessed`, shortest first. Each given clause is
+    resolved once against the processed clauses that contain the negation
+    of one of its literals (looked up in a literal index), then becomes
+    processed itself, so every pair is resolved at most once.
+
+    A new clause is dropped if a live clause subsumes it (forward
+    subsumption) and otherwise deletes every live clause it subsumes
+    (backward subsumption). The masks are exact clause signatures, so a
+    subset test is two AND-NOTs; candidates come from per-literal
+    occurrence lists. If `stats` is a dict, the pruned counts are stored
+    in it under 'forward_subsumed' and 'backward_subsumed'.
+    """
+    if stats is None:
+        stats = {}
+    stats['forward_subsumed'] = stats['backward_subsumed'] = 0
+
+    # Tautologies are always satisfied and would only produce tautologies
+    masks = {mask for mask in map(clause_to_mask, clauses) if not mask[0] & mask[1]}
+    if (0, 0) in masks:
+        return False
+
+    seen = set()
+    live = set()
+    unprocessed = []
+    occurrences = defaultdict(list)  # literal -> live (or since pruned) clauses containing it
+    partners = defaultdict(list)  # literal -> processed clauses containing it
+    counter = 0
+
+    def insert(mask):
+        nonlocal counter
+        if mask in seen:
+            return
+        seen.add(mask)
+        literals = mask_literals(mask)
+        for lit in literals:
+            for other in occurrences[lit]:
+                if other in live and subsumes(other, mask):
+                    stats['forward_subsumed'] += 1
+                    return
+        # Every clause that mask subsumes contains its rarest literal
+        rarest = min(literals, key=lambda lit: len(occurrences[lit]))
+        kept = []
+        for other in occurrences[rarest]:
+            if other not in live:
+                continue
+            if subsumes(mask, other):
+                live.discard(other)
+                stats['backward_subsumed'] += 1
+            else:
+                kept.append(other)
+        occurrences[rarest] = kept
+        live.add(mask)
+        for lit in literals:
+            occurrences[lit].append(mask)
+        heapq.heappush(unprocessed, (len(literals), counter, mask))
+        counter += 1
+
+    for mask in sorted(masks, key=lambda mask: mask[0].bit_count() + mask[1].bit_count()):
+        insert(mask)
+
+    processed = 0
+    while unprocessed:
+        _, _, given = heapq.heappop(unprocessed)
+        if given not in live:
+            continue  # Subsumed while waiting
+        literals = mask_literals(given)
+        for lit in literals:
+            for partner in partners[-lit]:
+                if partner not in live:
+                    continue
+                r = resolve(given, partner)
+                if r is None:
+                    continue
+                if r == (0, 0):
+                    return False  # Empty clause → UNSAT
+                insert(r)
+            if given not in live:
+                break  # A resolvent subsumed the given clause itself
+        else:
+            for lit in literals:
+                partners[lit].append(given)
+        processed += 1
+        if verbose and processed % 1000 == 0:
+            print(f"🔄 {processed} processed, {len(unprocessed)} waiting, "
+                  f"{stats['forward_subsumed'] + stats['backward_subsumed']} subsumed")
+
+    return True  # Saturated without the empty clause → SAT
+
+
+def resolution_with_stats(clauses):
+    """Runs resolution_algorithm and returns (is_sat, subsumption counts)."""
+    stats = {}
+    return resolution_algorithm(clauses, stats=stats), stats
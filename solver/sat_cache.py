@@ -0,0 +1,159 @@
+import os
+import mmap
+import struct
+import hashlib
+from sat_reader import read_dimacs_store
+from sat_clausedb import ClauseStore
+from sat_results import solver_version
+
+CACHE_DIR = os.environ.get('SAT_CNF_CACHE', os.path.join(os.path.expanduser('~'), '.cache', 'sat-solver', 'cnf'))
+MAX_ENTRIES = 10000
+MAGIC = b'CNFB'
+VERSION = 1
+# A .cnfb entry is this fixed header (magic, version, num_vars, num_clauses,
+# literal count, offset count) followed by the raw int32 literal and offset
+# buffers in native byte order
+HEADER = struct.Struct('=4sI4q')
+
+
+def content_hash(file_path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path(file_path, cache_dir=None):
+    """Cache entry for a CNF file, named after a hash of its raw bytes.
+
+    Each file has one ref file, keyed by its path, that remembers its size,
+    modification time and content hash, so an unchanged file is not read
+    again to find its entry. When the size or time changes the file is
+    hashed anew, and if the content changed, the entries of the old content
+    are deleted. The entry name also includes a hash of the parser sources,
+    so a new parser writes new entries; read_dimacs_cached removes the old
+    ones as it replaces them.
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    stat = os.stat(file_path)
+    stamp = [str(stat.st_size), str(stat.st_mtime_ns)]
+    key = hashlib.blake2b(os.path.abspath(file_path).encode(), digest_size=16).hexdigest()
+    ref = os.path.join(cache_dir, 'refs', key)
+    try:
+        with open(ref) as f:
+            fields = f.read().split()
+    except OSError:
+        fields = []
+    if len(fields) == 3 and fields[:2] == stamp and len(fields[2]) == 32:
+        content = fields[2]
+    else:  # new, touched or edited, or the ref was cut short by a crash
+        content = content_hash(file_path)
+        try:
+            os.makedirs(os.path.dirname(ref), exist_ok=True)
+            tmp = f"{ref}.{os.getpid()}.tmp"
+            with open(tmp, 'w') as f:
+                f.write(" ".join(stamp + [content]))
+            os.replace(tmp, ref)
+        except OSError:
+            pass  # the cache is only an optimization
+        if len(fields) == 3 and fields[2] != content:
+            remove_entries(cache_dir, fields[2])
+    parser = solver_version(read_dimacs_store.__module__)
+    return os.path.join(cache_dir, f"{content}-{parser}.cnfb")
+
+
+def remove_entries(cache_dir, content, keep=None):
+    """Deletes the entries for a content hash, whatever parser wrote them, except keep."""
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in names:
+        if name.startswith(content + '-') and name.endswith('.cnfb') and name != keep:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass  # still mapped on a platform that forbids removing it
+
+
+def prune(cache_dir, max_entries):
+    """Keeps the max_entries most recently used entries and as many refs."""
+    for folder, suffix in ((cache_dir, '.cnfb'), (os.path.join(cache_dir, 'refs'), '')):
+        try:
+            entries = [entry for entry in os.scandir(folder) if entry.is_file() and entry.name.endswith(suffix)]
+        except OSError:
+            continue
+        if len(entries) <= max_entries:
+            continue
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries[:len(entries) - max_entries]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+
+def save_store(path, num_vars, num_clauses, store):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, num_vars, num_clauses, len(store.literals), len(store.offsets)))
+        store.literals.tofile(f)
+        store.offsets.tofile(f)
+    os.replace(tmp, path)  # readers never see a half-written entry
+
+
+def load_store(path):
+    """Memory-maps a cache entry; returns (num_vars, num_clauses, ClauseStore) or None.
+
+    The store's literals and offsets are int32 views straight into the
+    mapping, so nothing is parsed or copied until the clauses are used.
+    The store owns the mapping; close it (or use it in a with block) to
+    unmap the file.
+    """
+    try:
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # missing or empty
+        return None
+    if len(mapped) < HEADER.size:
+        mapped.close()
+        return None
+    magic, version, num_vars, num_clauses, num_literals, num_offsets = HEADER.unpack_from(mapped)
+    if magic != MAGIC or version != VERSION or len(mapped) != HEADER.size + 4 * (num_literals + num_offsets):
+        mapped.close()
+        return None
+    split = HEADER.size + 4 * num_literals
+    with memoryview(mapped) as view:
+        literals = view[HEADER.size:split].cast('i')
+        offsets = view[split:].cast('i')
+    return num_vars, num_clauses, ClauseStore(literals, offsets, num_vars, mapped)
+
+
+def read_dimacs_cached(file_path, cache_dir=None, max_entries=MAX_ENTRIES):
+    """read_dimacs_store backed by an on-disk cache of parsed instances.
+
+    A hit marks its entry as recently used. A miss writes a new entry,
+    removes the entries an older parser wrote for the same content, and
+    then evicts the least recently used entries beyond max_entries, the
+    way ResultCache bounds itself.
+    """
+    cache_dir = cache_dir or CACHE_DIR
+    path = cache_path(file_path, cache_dir)
+    cached = load_store(path)
+    if cached is not None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return cached
+    num_vars, num_clauses, store = read_dimacs_store(file_path)
+    try:
+        save_store(path, num_vars, num_clauses, store)
+    except OSError:
+        return num_vars, num_clauses, store  # the cache is only an optimization
+    name = os.path.basename(path)
+    remove_entries(cache_dir, name.split('-')[0], keep=name)
+    prune(cache_dir, max_entries)
+    return num_vars, num_clauses, store
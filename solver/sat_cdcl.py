@@ -0,0 +1,289 @@
+from sat_reader import read_dimacs_store, is_cnf_file
+from sat_pool import SolverPool
+from sat_propagation import Propagator
+from sat_dpll_vsids import VSIDS
+import os
+from collections import deque
+
+RESTART_POLICIES = (None, 'luby', 'geometric', 'glucose')
+
+
+def process_all_files(directory_path, timeout=60):
+    pool = SolverPool()  # one warm worker for the whole folder
+    for filename in os.listdir(directory_path):
+        if is_cnf_file(filename):
+            file_path = os.path.join(directory_path, filename)
+            print(f"Processing file: {filename}")
+
+            try:
+                num_vars, num_clauses, clauses = read_dimacs_store(file_path)
+
+                is_sat, elapsed, status = pool.run(cdcl, clauses, timeout)
+                if status == 'timeout':
+                    print(f"{filename}: Timeout (> {timeout}s) — Skipping")
+                else:
+                    print(f"{filename}: {'SAT' if is_sat else 'UNSAT'} — {elapsed:.2f}s")
+
+            except Exception as e:
+                print(f"{filename}: Error — {e}")
+    pool.close()
+
+
+def luby(i):
+    """i-th element (from 1) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, ..."""
+    while True:
+        k = i.bit_length()
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+
+class CDCLSolver:
+    """Conflict-driven clause learning on top of the watched-literal Propagator.
+
+    Every conflict is analysed back to its first unique implication point,
+    the resulting clause is added to the clause database and the search
+    jumps back to the second-highest decision level in that clause.
+    Decisions come from VSIDS over every variable met during analysis.
+
+    `restarts` selects when the search drops back to level 0:
+      - 'luby': after restart_base * luby(k) conflicts for the k-th restart
+      - 'geometric': after restart_base conflicts, growing by restart_factor
+      - 'glucose': when the average LBD (number of distinct decision levels)
+        of the last `lbd_window` learned clauses exceeds the overall average
+        by more than 1 / lbd_margin
+      - None: never
+    Phase saving makes a restart resume close to the previous assignment.
+
+    The learned clause database is reduced after `reduce_interval` conflicts,
+    the interval growing by `reduce_increment` each time: `reduce_fraction`
+    of the learned clauses is deleted, highest LBD and least recently useful
+    (activity) first. Glue clauses (LBD <= glue_lbd) and clauses that are the
+    reason of a current assignment are always kept.
+    """
+
+    def __init__(self, clauses, activity_decay=0.95, restarts='glucose', restart_base=100,
+                 restart_factor=1.5, lbd_window=50, lbd_margin=0.8, phase_saving=True,
+                 reduce_interval=2000, reduce_increment=300, reduce_fraction=0.5, glue_lbd=2,
+                 clause_decay=0.999):
+        if restarts not in RESTART_POLICIES:
+            raise ValueError(f"Unknown restart policy: {restarts!r}")
+        self.engine = Propagator(clauses)
+        num_vars = self.engine.num_vars
+        self.brancher = VSIDS(num_vars, activity_decay, phase_saving)
+        self.seen = [False] * (num_vars + 1)
+        self.num_original = len(self.engine.clauses)
+        self.conflicts = 0
+        self.decisions = 0
+
+        self.restarts = restarts
+        self.restart_base = restart_base
+        self.restart_factor = restart_factor
+        self.restart_count = 0
+        self.restart_limit = restart_base
+        self.conflicts_since_restart = 0
+        self.recent_lbd = deque(maxlen=lbd_window)
+        self.lbd_margin = lbd_margin
+        self.lbd_total = 0
+
+        self.learned = []  # indices of learned clauses in the database
+        self.clause_lbd = {}
+        self.clause_activity = {}
+        self.clause_increment = 1.0
+        self.clause_decay = clause_decay
+        self.reduce_interval = reduce_interval
+        self.reduce_increment = reduce_increment
+        self.reduce_fraction = reduce_fraction
+        self.next_reduce = reduce_interval
+        self.glue_lbd = glue_lbd
+        self.reductions = 0
+        self.deleted_clauses = 0
+
+    def bump_clause(self, index):
+        activity = self.clause_activity
+        if index in activity:
+            activity[index] += self.clause_increment
+            if activity[index] > 1e20:
+                for key in activity:
+                    activity[key] *= 1e-20
+                self.clause_increment *= 1e-20
+
+    def reduce_db(self):
+        engine = self.engine
+        values = engine.values
+        reasons = engine.reasons
+        lbd = self.clause_lbd
+        activity = self.clause_activity
+
+        kept = []
+        candidates = []
+        for index in self.learned:
+            first = engine.clauses[index][0]
+            if lbd[index] <= self.glue_lbd or (values[first] == 1 and reasons[abs(first)] == index):
+                kept.append(index)
+            else:
+                candidates.append(index)
+
+        candidates.sort(key=lambda index: (-lbd[index], activity[index]))
+        doomed = candidates[:int(len(candidates) * self.reduce_fraction)]
+        engine.remove_clauses(doomed)
+        for index in doomed:
+            del lbd[index]
+            del activity[index]
+
+        self.learned = kept + candidates[len(doomed):]
+        self.reductions += 1
+        self.deleted_clauses += len(doomed)
+
+    def lbd(self, clause):
+        level_of = self.engine.level_of
+        return len({level_of[abs(lit)] for lit in clause})
+
+    def analyze(self, conflict):
+        """Returns the 1-UIP learned clause (asserting literal first) and the backjump level."""
+        engine = self.engine
+        trail = engine.trail
+        level_of = engine.level_of
+        reasons = engine.reasons
+        seen = self.seen
+        bump = self.brancher.bump
+        level = engine.decision_level
+
+        learned = [0]
+        pending = 0  # literals of the current level still to resolve away
+        literal = 0
+        index = len(trail) - 1
+        clause = engine.clauses[conflict]
+        self.bump_clause(conflict)
+
+        while True:
+            for lit in clause:
+                var = abs(lit)
+                if lit == literal or seen[var] or not level_of[var]:
+                    continue
+                seen[var] = True
+                bump(var)
+                if level_of[var] == level:
+                    pending += 1
+                else:
+                    learned.append(lit)
+
+            while not seen[abs(trail[index])]:
+                index -= 1
+            literal = trail[index]
+            index -= 1
+            seen[abs(literal)] = False
+            pending -= 1
+            if not pending:
+                break
+            clause = engine.clauses[reasons[abs(literal)]]
+            self.bump_clause(reasons[abs(literal)])
+
+        learned[0] = -literal
+
+        # Drop literals implied by the rest of the clause
+        minimized = [learned[0]]
+        for lit in learned[1:]:
+            reason = reasons[abs(lit)]
+            if reason is None or not all(
+                seen[abs(q)] or not level_of[abs(q)] for q in engine.clauses[reason][1:]
+            ):
+                minimized.append(lit)
+        for lit in learned[1:]:
+            seen[abs(lit)] = False
+        learned = minimized
+
+        # Watch the highest-level literal after the asserting one
+        backjump = 0
+        for i in range(1, len(learned)):
+            lit_level = level_of[abs(learned[i])]
+            if lit_level > backjump:
+                backjump = lit_level
+                learned[1], learned[i] = learned[i], learned[1]
+        return learned, backjump
+
+    def restart_due(self):
+        if self.restarts == 'glucose':
+            recent = self.recent_lbd
+            return (len(recent) == recent.maxlen and
+                    sum(recent) * self.lbd_margin > self.lbd_total * len(recent) / self.conflicts)
+        if self.restarts is None:
+            return False
+        return self.conflicts_since_restart >= self.restart_limit
+
+    def restart(self):
+        self.restart_count += 1
+        self.conflicts_since_restart = 0
+        self.recent_lbd.clear()
+        if self.restarts == 'luby':
+            self.restart_limit = self.restart_base * luby(self.restart_count + 1)
+        elif self.restarts == 'geometric':
+            self.restart_limit *= self.restart_factor
+        self.brancher.on_backtrack(self.engine.backtrack(0))
+
+    def solve(self):
+        engine = self.engine
+        while True:
+            conflict = engine.propagate()
+            if conflict is not None:
+                if not engine.decision_level:
+                    return False
+                self.conflicts += 1
+                self.conflicts_since_restart += 1
+                learned, backjump = self.analyze(conflict)
+                lbd = self.lbd(learned)
+                self.lbd_total += lbd
+                self.recent_lbd.append(lbd)
+                self.brancher.decay()
+                self.clause_increment /= self.clause_decay
+                self.brancher.on_backtrack(engine.backtrack(backjump))
+                if len(learned) == 1:
+                    engine.assign(learned[0])
+                else:
+                    index = engine.add_clause(learned)
+                    self.learned.append(index)
+                    self.clause_lbd[index] = lbd
+                    self.clause_activity[index] = self.clause_increment
+                    engine.assign(learned[0], index)
+                if self.restart_due():
+                    self.restart()
+                if self.conflicts >= self.next_reduce:
+                    self.reduce_interval += self.reduce_increment
+                    self.next_reduce += self.reduce_interval
+                    self.reduce_db()
+                continue
+
+            literal = self.brancher.pick(engine)
+            if literal is None:
+                return True  # every variable assigned without conflict
+            self.decisions += 1
+            engine.decide(literal)
+
+
+def cdcl(clauses, restarts='glucose', phase_saving=True, reduce_interval=2000, reduce_increment=300,
+         reduce_fraction=0.5, glue_lbd=2, model=False):
+    """With model=True, returns (is_sat, model), model listing the true literals or None."""
+    solver = CDCLSolver(clauses, restarts=restarts, phase_saving=phase_saving, reduce_interval=reduce_interval,
+                        reduce_increment=reduce_increment, reduce_fraction=reduce_fraction, glue_lbd=glue_lbd)
+    is_sat = solver.solve()
+    return (is_sat, solver.engine.model() if is_sat else None) if model else is_sat
+
+
+def cdcl_with_stats(clauses, restarts='glucose', phase_saving=True, reduce_interval=2000, reduce_increment=300,
+                    reduce_fraction=0.5, glue_lbd=2):
+    """Runs CDCL like cdcl and returns (is_sat, search and clause database counts)."""
+    solver = CDCLSolver(clauses, restarts=restarts, phase_saving=phase_saving, reduce_interval=reduce_interval,
+                        reduce_increment=reduce_increment, reduce_fraction=reduce_fraction, glue_lbd=glue_lbd)
+    is_sat = solver.solve()
+    return is_sat, {
+        'conflicts': solver.conflicts,
+        'decisions': solver.decisions,
+        'restarts': solver.restart_count,
+        'reductions': solver.reductions,
+        'deleted_clauses': solver.deleted_clauses
+    }
+
+
+if __name__ == "__main__":
+    directory_path = 'C:\\Users\\andre\\SAT-Solver\\cnfs\\50-250\\UF250.1065.100'
+    process_all_files(directory_path)
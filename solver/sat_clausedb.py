@@ -0,0 +1,78 @@
+from array import array
+
+
+class ClauseStore:
+    """Clauses packed into one flat array of literals plus an offsets array.
+
+    Clause i is literals[offsets[i]:offsets[i + 1]] and is referred to by its
+    index. Variables keep their DIMACS numbers, which are already dense
+    (1..num_vars), so literals can index value arrays directly. A clause
+    costs 4 bytes per literal plus 4 for its offset instead of a frozenset
+    object, and the store pickles as two raw byte buffers.
+
+    Iterating yields each clause as a tuple, so a store can be passed to any
+    solver entry point that takes a list of clauses.
+
+    A store whose buffers view a memory mapping (see sat_cache) owns it as
+    `mapping`; `close`, or leaving a `with` block, releases the views and
+    unmaps it.
+    """
+
+    def __init__(self, literals, offsets, num_vars=None, mapping=None):
+        self.literals = literals
+        self.offsets = offsets
+        if num_vars is None:
+            num_vars = max(map(abs, literals), default=0)
+        self.num_vars = num_vars
+        self.mapping = mapping
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self.mapping is None:
+            return
+        for buffer in (self.literals, self.offsets):
+            if isinstance(buffer, memoryview):
+                buffer.release()
+        self.mapping.close()
+        self.mapping = None
+
+    @classmethod
+    def from_clauses(cls, clauses, num_vars=None):
+        literals = array('i')
+        offsets = array('i', [0])
+        for clause in clauses:
+            literals.extend(clause)
+            offsets.append(len(literals))
+        return cls(literals, offsets, num_vars)
+
+    def __getstate__(self):
+        # Buffers memory-mapped from the parse cache cannot be pickled, so
+        # they are copied into arrays on the way to a worker process
+        state = dict(self.__dict__, mapping=None)
+        for name in ('literals', 'offsets'):
+            if not isinstance(state[name], array):
+                packed = array('i')
+                packed.frombytes(memoryview(state[name]).cast('B'))
+                state[name] = packed
+        return state
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return tuple(self.literals[self.offsets[index]:self.offsets[index + 1]])
+
+    def __iter__(self):
+        literals = self.literals
+        offsets = self.offsets
+        for i in range(len(offsets) - 1):
+            yield tuple(literals[offsets[i]:offsets[i + 1]])
+
+    def sizes(self):
+        offsets = self.offsets
+        return [offsets[i + 1] - offsets[i] for i in range(len(offsets) - 1)]
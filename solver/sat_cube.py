@@ -0,0 +1,164 @@
+from sat_reader import read_dimacs_store, is_cnf_file
+from sat_pool import Scheduler
+from sat_propagation import Propagator
+from sat_search import dpll_search
+from sat_dpll_most_freq import MostFrequent
+from functools import partial
+from collections import Counter
+import os
+import time
+
+
+def lookahead(engine, variables):
+    """Scores each variable by how much both of its branches propagate.
+
+    Returns (best, forced): the variable maximizing the product of the
+    two branches' implied literal counts, and the literals whose opposite
+    branch ended in a conflict (failed literals), which hold in every model
+    of the current node. If a variable fails both ways, the node itself is
+    refuted and (None, None) is returned.
+    """
+    best, best_score = None, -1
+    forced = []
+    for var in variables:
+        counts = {}
+        for lit in (var, -var):
+            level = engine.decision_level
+            before = len(engine.trail)
+            engine.decide(lit)
+            if engine.propagate() is None:
+                counts[lit] = len(engine.trail) - before
+            engine.backtrack(level)
+        if not counts:
+            return None, None
+        if len(counts) == 1:
+            forced.extend(counts)  # the branch that survived
+            continue
+        score = counts[var] * counts[-var]
+        if score > best_score:
+            best, best_score = var, score
+    return best, forced
+
+
+def make_cubes(clauses, depth, candidates=20):
+    """Splits a formula into cubes with a lookahead heuristic.
+
+    Returns (status, cubes): status is True if a model turned up while
+    splitting, False if every branch was refuted, and None when the cubes
+    (lists of literals, at most `depth` decisions each plus the failed
+    literals found on the way) are left to solve. Only the `candidates`
+    variables occurring most often in the open clauses are looked ahead.
+    """
+    engine = Propagator(clauses)
+    cubes = []
+
+    def split(cube, depth):
+        while True:
+            if engine.propagate() is not None:
+                return False
+            open_clauses = list(engine.open_clauses())
+            if not open_clauses:
+                return True
+            if depth == 0:
+                cubes.append(cube)
+                return False
+
+            occurrences = Counter(abs(lit) for clause in open_clauses for lit in clause)
+            variables = [var for var, _ in occurrences.most_common(candidates)]
+            var, forced = lookahead(engine, variables)
+            if forced is None:
+                return False
+            if not forced:
+                break
+            for lit in forced:
+                if not engine.assign(lit):
+                    return False
+            cube = cube + forced
+
+        for lit in (var, -var):
+            level = engine.decision_level
+            engine.decide(lit)
+            found = split(cube + [lit], depth - 1)
+            engine.backtrack(level)
+            if found:
+                return True
+        return False
+
+    if split([], depth):
+        return True, []
+    return (None, cubes) if cubes else (False, [])
+
+
+def solve_cube(clauses, cube):
+    """DPLL (most-frequent branching) on clauses under the cube's assumptions."""
+    engine = Propagator(clauses)
+    return dpll_search(engine, MostFrequent(engine), assumptions=cube)
+
+
+def cube_and_conquer(clauses, workers=None, depth=None, timeout=None, scheduler=None):
+    """Solves one instance by splitting it into cubes solved in parallel.
+
+    The cubes are farmed out to a Scheduler; the first satisfiable cube
+    ends the run and kills the remaining workers, and the formula is
+    unsatisfiable once every cube is refuted. By default the split goes
+    deep enough for about eight cubes per worker. Returns True, False, or
+    None if the timeout ran out or a cube could not be solved. Pass a
+    Scheduler to keep its workers warm across instances.
+    """
+    if scheduler is None:
+        with Scheduler(workers) as scheduler:
+            return cube_and_conquer(clauses, workers, depth, timeout, scheduler)
+    if depth is None:
+        depth = (8 * scheduler.size - 1).bit_length()
+    deadline = time.monotonic() + timeout if timeout is not None else None
+
+    status, cubes = make_cubes(clauses, depth)
+    if status is not None:
+        return status
+
+    def tasks():
+        for i, cube in enumerate(cubes):
+            remaining = deadline - time.monotonic() if deadline is not None else None
+            if remaining is not None and remaining <= 0:
+                return
+            yield i, partial(solve_cube, cube=cube), clauses, remaining
+
+    refuted = 0
+    try:
+        for _, result, _, _, status in scheduler.run(tasks()):
+            if status is not None:
+                return None
+            if result:
+                return True
+            refuted += 1
+    finally:
+        scheduler.cancel()
+    return False if refuted == len(cubes) else None
+
+
+def process_all_files(directory_path, timeout=60):
+    scheduler = Scheduler()  # one set of warm workers for the whole folder
+    for filename in os.listdir(directory_path):
+        if is_cnf_file(filename):
+            file_path = os.path.join(directory_path, filename)
+            print(f"Processing file: {filename}")
+
+            try:
+                num_vars, num_clauses, clauses = read_dimacs_store(file_path)
+
+                start = time.perf_counter()
+                is_sat = cube_and_conquer(clauses, timeout=timeout, scheduler=scheduler)
+                elapsed = time.perf_counter() - start
+                if is_sat is None:
+                    print(f"{filename}: Timeout (> {timeout}s) — Skipping")
+                else:
+                    print(f"{filename}: {'SAT' if is_sat else 'UNSAT'} — {elapsed:.2f}s")
+
+            except Exception as e:
+                print(f"{filename}: Error — {e}")
+    scheduler.close()
+
+
+if __name__ == "__main__":
+    directory_path = 'C:\\Users\\andre\\SAT-Solver\\cnfs\\50-250\\UF250.1065.100'
+    process_all_files(directory_path)
@@ -2,89 +2,218 @@ import os
 import functools
 from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor, TimeoutError
-from sat_reader import read_dimacs_cnf  # make sure this is working
-import multiprocessing
+from sat_reader import read_dimacs_cnf, read_dimacs_store, is_cnf_file  # make sure this is working
+from sat_pool import SolverPool
+from sat_heap import VarHeap
 
 print = functools.partial(print, flush=True)  # always flush output
 
 def process_all_files(directory_path, timeout=60):
+    pool = SolverPool()  # one warm worker for the whole folder
     for filename in os.listdir(directory_path):
-        if filename.endswith(".cnf"):
+        if is_cnf_file(filename):
             file_path = os.path.join(directory_path, filename)
             print(f"Processing file: {filename}")
             
             try:
-                num_vars, num_clauses, raw_clauses = read_dimacs_cnf(file_path)
-                clauses = {frozenset(clause) for clause in raw_clauses}
-
-                # Spawn a separate process (not just a thread pool)
-                with multiprocessing.get_context("spawn").Pool(1) as pool:
-                    async_result = pool.apply_async(dp_algorithm, (clauses,))
-                    try:
-                        is_sat = async_result.get(timeout=timeout)
-                        print(f"{filename}: {'SAT' if is_sat else 'UNSAT'}")
-                    except multiprocessing.TimeoutError:
-                        pool.terminate()  # Force-stop the process
-                        pool.join()
-                        print(f"{filename}: Timeout (> {timeout}s) — Skipping")
+                num_vars, num_clauses, clauses = read_dimacs_store(file_path)
+
+                is_sat, elapsed, status = pool.run(dp_algorithm, clauses, timeout)
+                if status == 'timeout':
+                    print(f"{filename}: Timeout (> {timeout}s) — Skipping")
+                else:
+                    print(f"{filename}: {'SAT' if is_sat else 'UNSAT'} — {elapsed:.2f}s")
 
             except Exception as e:
                 print(f"{filename}: Error — {e}")
+    pool.close()
 
 
 
-def unit_clause_elimination(clauses, assignment, debug=False):
-    changed = True
-    while changed:
-        changed = False
-        unit_clauses = [c for c in clauses if len(c) == 1]
-        if not unit_clauses:
-            break
-        if debug:
-            print(f"  📌 Unit clauses: {unit_clauses}")
-        for unit in unit_clauses:
-            literal = next(iter(unit))
-            assignment.add(literal)
-            new_clauses = []
-            for clause in clauses:
-                if literal in clause:
-                    continue
-                if -literal in clause:
-                    new_clause = clause - {-literal}
-                    if not new_clause:
-                        return None, None
-                    new_clauses.append(new_clause)
-                else:
-                    new_clauses.append(clause)
-            clauses = new_clauses
-            changed = True
-            if debug:
-                print(f"    → Assigned {literal}, remaining {len(clauses)} clauses")
-    return clauses, assignment
+class OccurrenceIndex:
+    """The live clauses of a DP run, indexed by the literals they contain.
+
+    Clauses are kept by id, and `occurrences` maps each literal to the ids
+    of the clauses containing it. The index is updated in place by unit
+    propagation, pure literal removal and resolution, so looking up a
+    variable's occurrences never scans the formula. For forward
+    subsumption each clause is also listed once in `watched`, under the
+    literal that was rarest when it was added. Unless `queue_units` is
+    False, the ids of new unit clauses are queued in `units` for
+    unit_clause_elimination.
+
+    It also keeps the remaining variables in a heap ordered by elimination
+    cost pos × neg (the number of resolvents before tautologies and
+    subsumption are dropped). Only variables whose occurrences changed
+    since the last pick are re-sifted.
+    """
+
+    def __init__(self, clauses, num_vars, queue_units=True):
+        self.clauses = {}
+        self.signatures = {}
+        self.occurrences = defaultdict(set)
+        self.watched = defaultdict(set)
+        self.watch = {}
+        self.units = []
+        self.queue_units = queue_units
+        self.touched = set()
+        self.next_id = 0
+        for clause in clauses:
+            self.add(clause)
+        self.costs = [0] * (num_vars + 1)  # negated, VarHeap is a max-heap
+        for var in range(1, num_vars + 1):
+            self.costs[var] = -self.cost(var)
+        self.order = VarHeap(self.costs, (var for var in range(1, num_vars + 1) if self.occurs(var)))
+        self.touched.clear()
 
+    def __len__(self):
+        return len(self.clauses)
 
-def pure_literal_elimination(clauses, assignment, debug=False):
-    counts = defaultdict(int)
-    for clause in clauses:
+    def add(self, clause, sig=None):
+        cid = self.next_id
+        self.next_id += 1
+        self.clauses[cid] = clause
+        self.signatures[cid] = signature(clause) if sig is None else sig
+        if clause:
+            watch = min(clause, key=lambda lit: len(self.occurrences[lit]))
+            self.watch[cid] = watch
+            self.watched[watch].add(cid)
+            if len(clause) == 1 and self.queue_units:
+                self.units.append(cid)
         for lit in clause:
-            counts[lit] += 1
-    pure_literals = {lit for lit in counts if -lit not in counts}
+            self.occurrences[lit].add(cid)
+            self.touched.add(abs(lit))
+        return cid
+
+    def remove(self, cid):
+        clause = self.clauses.pop(cid)
+        del self.signatures[cid]
+        if clause:
+            self.watched[self.watch.pop(cid)].discard(cid)
+        for lit in clause:
+            self.occurrences[lit].discard(cid)
+            self.touched.add(abs(lit))
+        return clause
+
+    def occurs(self, var):
+        return bool(self.occurrences[var] or self.occurrences[-var])
+
+    def cost(self, var):
+        return len(self.occurrences[var]) * len(self.occurrences[-var])
+
+    def cheapest(self):
+        """Pops the remaining variable with the fewest potential resolvents."""
+        for var in self.touched:
+            self.costs[var] = -self.cost(var)
+            self.order.update(var)
+        self.touched.clear()
+        while self.order:
+            var = self.order.pop()
+            # A variable that has left the formula never comes back
+            if self.occurs(var):
+                return var
+        return None
+
+
+def unit_clause_elimination(index, assignment, debug=False):
+    """Propagates the queued unit clauses of the index to a fixpoint.
+
+    Assigning a literal visits only the clauses in its occurrence lists:
+    those containing it are removed, those containing its negation are
+    shortened, and a clause shortened to one literal joins the queue.
+    """
+    units = index.units
+    if debug and units:
+        print(f"  📌 Unit clauses: {[index.clauses[cid] for cid in units if cid in index.clauses]}")
+    while units:
+        cid = units.pop()
+        if cid not in index.clauses:
+            continue  # satisfied by an earlier unit
+        literal = next(iter(index.clauses[cid]))
+        assignment.add(literal)
+        for other in list(index.occurrences[literal]):
+            index.remove(other)
+        for other in list(index.occurrences[-literal]):
+            new_clause = index.remove(other) - {-literal}
+            if not new_clause:
+                units.clear()
+                return None, None
+            index.add(new_clause)
+        if debug:
+            print(f"    → Assigned {literal}, remaining {len(index)} clauses")
+    return index, assignment
+
+
+def pure_literal_elimination(index, assignment, debug=False):
+    occurrences = index.occurrences
+    pure_literals = {lit for lit, ids in occurrences.items() if ids and not occurrences.get(-lit)}
     if debug and pure_literals:
         print(f"  ✨ Pure literals: {pure_literals}")
     if not pure_literals:
-        return clauses, assignment
+        return index, assignment
     assignment.update(pure_literals)
-    new_clauses = [c for c in clauses if c.isdisjoint(pure_literals)]
+    for lit in pure_literals:
+        for cid in list(occurrences[lit]):
+            index.remove(cid)
     if debug:
-        print(f"    → Eliminated clauses with {pure_literals}, remaining {len(new_clauses)} clauses")
-    return new_clauses, assignment
+        print(f"    → Eliminated clauses with {pure_literals}, remaining {len(index)} clauses")
+    return index, assignment
+
+
+def signature(clause):
+    """64-bit clause signature: bit (lit mod 64) set for each literal.
+
+    If a is a subset of b then signature(a) & ~signature(b) == 0, so most
+    failed subset tests are decided by one AND-NOT.
+    """
+    sig = 0
+    for lit in clause:
+        sig |= 1 << (lit & 63)
+    return sig
 
 
-def resolve_clauses(clauses, variable, debug=False):
+def merge_resolvents(index, resolvents, stats=None):
+    """Adds resolvents to the index with forward and backward subsumption.
+
+    A resolvent already covered by a live clause is dropped (forward), and
+    live clauses that a resolvent covers are deleted (backward). Candidates
+    are filtered by signature before the frozenset subset test. A subsumer
+    lies inside the resolvent, so it is found through the one literal each
+    clause is watched under; subsumed clauses contain all of the
+    resolvent, so they are found through its rarest literal. Returns False
+    if the empty clause was derived.
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('forward_subsumed', 0)
+    stats.setdefault('backward_subsumed', 0)
+    clauses = index.clauses
+    signatures = index.signatures
+    occurrences = index.occurrences
+    watched = index.watched
+
+    for resolvent in sorted(resolvents, key=len):
+        if not resolvent:
+            return False
+        sig = signature(resolvent)
+        if any(not signatures[i] & ~sig and clauses[i] <= resolvent
+               for lit in resolvent for i in watched[lit]):
+            stats['forward_subsumed'] += 1
+            continue
+        # Every clause the resolvent subsumes contains its rarest literal
+        rarest = min(resolvent, key=lambda lit: len(occurrences[lit]))
+        for i in [i for i in occurrences[rarest] if not sig & ~signatures[i] and resolvent <= clauses[i]]:
+            index.remove(i)
+            stats['backward_subsumed'] += 1
+        index.add(resolvent, sig)
+    return True
+
+
+def resolve_clauses(index, variable, debug=False, stats=None):
     if debug:
         print(f"  🔀 Resolving on variable: {variable}")
-    pos_clauses = [c for c in clauses if variable in c]
-    neg_clauses = [c for c in clauses if -variable in c]
+    pos_clauses = [index.remove(i) for i in list(index.occurrences[variable])]
+    neg_clauses = [index.remove(i) for i in list(index.occurrences[-variable])]
     new_clauses = set()
     for c1 in pos_clauses:
         for c2 in neg_clauses:
@@ -92,46 +221,60 @@ def resolve_clauses(clauses, variable, debug=False):
             if any(-lit in resolvent for lit in resolvent):
                 continue
             new_clauses.add(frozenset(resolvent))
-    remaining = [c for c in clauses if variable not in c and -variable not in c]
-    remaining.extend(new_clauses)
+    consistent = merge_resolvents(index, new_clauses, stats)
     if debug:
-        print(f"    → Generated {len(new_clauses)} resolvents, {len(remaining)} total clauses now")
-    return remaining
+        print(f"    → Generated {len(new_clauses)} resolvents, {len(index)} total clauses now")
+    return consistent
 
 
-def dp_algorithm(clauses, assignment=None, debug=False):
+def dp_algorithm(clauses, assignment=None, debug=False, stats=None):
     if assignment is None:
         assignment = set()
+    if stats is None:
+        stats = {}
+    stats.setdefault('forward_subsumed', 0)
+    stats.setdefault('backward_subsumed', 0)
+    clauses = [frozenset(clause) for clause in clauses]
+    if any(not c for c in clauses):
+        return False
+    # Resolving a tautology {v, -v, ...} on v would derive clauses it does not imply
+    clauses = [c for c in clauses if not any(-lit in c for lit in c)]
+    num_vars = max((abs(lit) for c in clauses for lit in c), default=0)
+    index = OccurrenceIndex(clauses, num_vars)
     step = 0
     while True:
         step += 1
         if debug:
-            print(f"\n🧩 Step {step} — {len(clauses)} clauses")
-        clauses, assignment = unit_clause_elimination(clauses, assignment, debug)
-        if clauses is None:
+            print(f"\n🧩 Step {step} — {len(index)} clauses")
+        index, assignment = unit_clause_elimination(index, assignment, debug)
+        if index is None:
             if debug:
                 print("❌ Conflict during unit propagation")
             return False
-        if not clauses:
+        if not index:
             if debug:
                 print("✅ All clauses satisfied")
             return True
-        clauses, assignment = pure_literal_elimination(clauses, assignment, debug)
-        if not clauses:
+        index, assignment = pure_literal_elimination(index, assignment, debug)
+        if not index:
             if debug:
                 print("✅ All clauses satisfied after pure literal elimination")
             return True
-        literals = {abs(lit) for clause in clauses for lit in clause}
-        if not literals:
+        var = index.cheapest()
+        if var is None:
             return True
-        var = next(iter(literals))
-        clauses = resolve_clauses(clauses, var, debug)
-        if any(len(c) == 0 for c in clauses):
+        if not resolve_clauses(index, var, debug, stats):
             if debug:
                 print("❌ Empty clause found after resolution")
             return False
 
 
+def dp_with_stats(clauses):
+    """Runs dp_algorithm and returns (is_sat, subsumption counts)."""
+    stats = {}
+    return dp_algorithm(clauses, stats=stats), stats
+
+
 def process_file(file_path):
     print(f"\n🔍 Starting to process file: {os.path.basename(file_path)}")
     num_vars, num_clauses, raw_clauses = read_dimacs_cnf(file_path)
@@ -1,72 +1,32 @@
-from sat_reader import read_dimacs_cnf
+from sat_reader import read_dimacs_store, is_cnf_file
+from sat_pool import SolverPool
+from sat_propagation import Propagator
+from sat_search import CountingBrancher, dpll_search
 import os
 import math
 from collections import defaultdict
-import multiprocessing
 from itertools import combinations
 
 
 def process_all_files(directory_path, timeout=60):
+    pool = SolverPool()  # one warm worker for the whole folder
     for filename in os.listdir(directory_path):
-        if filename.endswith(".cnf"):
+        if is_cnf_file(filename):
             file_path = os.path.join(directory_path, filename)
             print(f"Processing file: {filename}")
             
             try:
-                num_vars, num_clauses, raw_clauses = read_dimacs_cnf(file_path)
-                clauses = {frozenset(clause) for clause in raw_clauses}
-
-                # Spawn a separate process (not just a thread pool)
-                with multiprocessing.get_context("spawn").Pool(1) as pool:
-                    async_result = pool.apply_async(dpll_jw, (clauses,))
-                    try:
-                        is_sat = async_result.get(timeout=timeout)
-                        print(f"{filename}: {'SAT' if is_sat else 'UNSAT'}")
-                    except multiprocessing.TimeoutError:
-                        pool.terminate()  # Force-stop the process
-                        pool.join()
-                        print(f"{filename}: Timeout (> {timeout}s) — Skipping")
+                num_vars, num_clauses, clauses = read_dimacs_store(file_path)
 
-            except Exception as e:
-                print(f"{filename}: Error — {e}")
-
-
-def unit_propagate(clauses, assignment):
-    changed = True
-    while changed:
-        changed = False
-        unit_clauses = [c for c in clauses if len(c) == 1]
-        for unit in unit_clauses:
-            literal = next(iter(unit))
-            assignment.add(literal)
-            new_clauses = []
-            for clause in clauses:
-                if literal in clause:
-                    continue
-                if -literal in clause:
-                    new_clause = set(clause)
-                    new_clause.discard(-literal)
-                    if not new_clause:
-                        return None, None
-                    new_clauses.append(new_clause)
+                is_sat, elapsed, status = pool.run(dpll_jw, clauses, timeout)
+                if status == 'timeout':
+                    print(f"{filename}: Timeout (> {timeout}s) — Skipping")
                 else:
-                    new_clauses.append(set(clause))
-            clauses = new_clauses
-            changed = True
-    return clauses, assignment
-
+                    print(f"{filename}: {'SAT' if is_sat else 'UNSAT'} — {elapsed:.2f}s")
 
-def pure_literal_elimination(clauses, assignment):
-    all_literals = set(lit for clause in clauses for lit in clause)
-    pure_literals = {lit for lit in all_literals if -lit not in all_literals}
-
-    if not pure_literals:
-        return clauses, assignment
-
-    assignment |= pure_literals
-    new_clauses = [clause for clause in clauses if not clause & pure_literals]
-
-    return new_clauses, assignment
+            except Exception as e:
+                print(f"{filename}: Error — {e}")
+    pool.close()
 
 
 def choose_literal_jw(clauses):
@@ -81,50 +41,78 @@ def choose_literal_jw(clauses):
     return max(scores, key=scores.get)
 
 
-def dpll_jw(clauses, assignment=None):
-    if assignment is None:
-        assignment = set()
-
-    clauses = [set(clause) for clause in clauses]
-
-    clauses, assignment = unit_propagate(clauses, assignment)
-    if clauses is None:
-        return False
-    if not clauses:
-        return True
-
-    clauses, assignment = pure_literal_elimination(clauses, assignment)
-    if not clauses:
-        return True
-
-    literal = choose_literal_jw(clauses)
-    if literal is None:
-        return False
-
-    # Try assigning literal True
-    new_clauses = []
-    for clause in clauses:
-        if literal in clause:
-            continue
-        new_clause = set(clause)
-        new_clause.discard(-literal)
-        if not new_clause:
-            continue
-        new_clauses.append(new_clause)
-    if dpll_jw(new_clauses, assignment | {literal}):
-        return True
-
-    # Try assigning literal False
-    new_clauses = []
-    for clause in clauses:
-        if -literal in clause:
-            continue
-        new_clause = set(clause)
-        new_clause.discard(literal)
-        if not new_clause:
-            continue
-        new_clauses.append(new_clause)
-    return dpll_jw(new_clauses, assignment | {-literal})
+class JeroslowWang(CountingBrancher):
+    """choose_literal_jw with scores maintained as the trail changes.
+
+    score[lit] is the sum of 2 ** -free over the unsatisfied clauses that
+    contain lit, where free is the number of unassigned literals left in the
+    clause. Every clause tracks its true and free literal counts, so an
+    assignment only touches the clauses containing the literal or its
+    negation. The weights are powers of two, so the sums stay exact and
+    the scores match a full rescan; only ties may be broken differently.
+    Pure literals come from the counts of CountingBrancher.
+    """
+
+    def __init__(self, engine):
+        clauses = engine.clauses
+        self.free_count = [len(clause) for clause in clauses]
+        self.weights = [2.0 ** -k for k in range(max(self.free_count, default=0) + 1)]
+        self.scores = [0.0] * (2 * engine.num_vars + 1)
+        for clause in clauses:
+            weight = self.weights[len(clause)]
+            for lit in clause:
+                self.scores[lit] += weight
+        super().__init__(engine, self.scores)
+
+    def _shift(self, clause, delta):
+        scores = self.scores
+        heap = self.heap
+        for lit in clause:
+            scores[lit] += delta
+            if delta > 0:
+                heap.increased(lit)
+            else:
+                heap.decreased(lit)
+
+    def satisfied(self, index):
+        self._shift(self.engine.clauses[index], -self.weights[self.free_count[index]])
+
+    def unsatisfied(self, index):
+        self._shift(self.engine.clauses[index], self.weights[self.free_count[index]])
+
+    def assigned(self, literal):
+        super().assigned(literal)  # satisfied() still sees the old free counts
+        clauses = self.engine.clauses
+        true_count = self.true_count
+        free_count = self.free_count
+        weights = self.weights
+        for index in self.occurrences[literal]:
+            free_count[index] -= 1
+        for index in self.occurrences[-literal]:
+            free = free_count[index]
+            free_count[index] = free - 1
+            if not true_count[index]:
+                self._shift(clauses[index], weights[free])
+
+    def unassigned(self, literal):
+        clauses = self.engine.clauses
+        true_count = self.true_count
+        free_count = self.free_count
+        weights = self.weights
+        for index in self.occurrences[-literal]:
+            free_count[index] += 1
+            if not true_count[index]:
+                self._shift(clauses[index], -weights[free_count[index]])
+        for index in self.occurrences[literal]:
+            free_count[index] += 1
+        super().unassigned(literal)  # unsatisfied() sees the restored free counts
+
+
+def dpll_jw(clauses, model=False):
+    """With model=True, returns (is_sat, model), model listing the true literals or None."""
+    engine = Propagator(clauses)
+    is_sat = dpll_search(engine, JeroslowWang(engine))
+    return (is_sat, engine.model() if is_sat else None) if model else is_sat
 
 
 if __name__ == "__main__":
@@ -0,0 +1,94 @@
+from sat_reader import read_dimacs_store, is_cnf_file
+from sat_pool import SolverPool
+from sat_propagation import Propagator
+from sat_search import Brancher, dpll_search
+from sat_heap import VarHeap
+import os
+
+
+def process_all_files(directory_path, timeout=60):
+    pool = SolverPool()  # one warm worker for the whole folder
+    for filename in os.listdir(directory_path):
+        if is_cnf_file(filename):
+            file_path = os.path.join(directory_path, filename)
+            print(f"Processing file: {filename}")
+
+            try:
+                num_vars, num_clauses, clauses = read_dimacs_store(file_path)
+
+                is_sat, elapsed, status = pool.run(dpll_vsids, clauses, timeout)
+                if status == 'timeout':
+                    print(f"{filename}: Timeout (> {timeout}s) — Skipping")
+                else:
+                    print(f"{filename}: {'SAT' if is_sat else 'UNSAT'} — {elapsed:.2f}s")
+
+            except Exception as e:
+                print(f"{filename}: Error — {e}")
+    pool.close()
+
+
+class VSIDS(Brancher):
+    """Variable activity heuristic: bump on conflict, decay over time.
+
+    Activities live in a VarHeap, so picking the most active unassigned
+    variable costs O(log n). Assigned variables are only dropped lazily when
+    they reach the top and are pushed back when backtracking unassigns them.
+    Variables are decided false unless `phase_saving` is set, in which case
+    they get the value they last had before being unassigned.
+    """
+
+    def __init__(self, num_vars, decay=0.95, phase_saving=False):
+        self.activity = [0.0] * (num_vars + 1)
+        self.increment = 1.0
+        self.decay_factor = decay
+        self.heap = VarHeap(self.activity, range(1, num_vars + 1))
+        self.phase_saving = phase_saving
+        self.phase = [-1] * (num_vars + 1)
+
+    def bump(self, var):
+        activity = self.activity
+        activity[var] += self.increment
+        if activity[var] > 1e100:
+            # Rescaling keeps the order, so the heap stays valid
+            for i in range(len(activity)):
+                activity[i] *= 1e-100
+            self.increment *= 1e-100
+        self.heap.increased(var)
+
+    def decay(self):
+        self.increment /= self.decay_factor
+
+    def pick(self, engine):
+        values = engine.values
+        heap = self.heap
+        while heap:
+            var = heap.pop()
+            if not values[var]:
+                return var if self.phase[var] > 0 else -var
+        return None
+
+    def on_conflict(self, engine, conflict):
+        for lit in engine.clauses[conflict]:
+            self.bump(abs(lit))
+        self.decay()
+
+    def on_backtrack(self, literals):
+        heap = self.heap
+        phase = self.phase
+        for lit in literals:
+            var = abs(lit)
+            heap.push(var)
+            if self.phase_saving:
+                phase[var] = 1 if lit > 0 else -1
+
+
+def dpll_vsids(clauses, model=False):
+    """With model=True, returns (is_sat, model), model listing the true literals or None."""
+    engine = Propagator(clauses)
+    is_sat = dpll_search(engine, VSIDS(engine.num_vars), pure_literals=False)
+    return (is_sat, engine.model() if is_sat else None) if model else is_sat
+
+
+if __name__ == "__main__":
+    directory_path = 'C:\\Users\\andre\\SAT-Solver\\cnfs\\50-250\\uf100-430'
+    process_all_files(directory_path)
@@ -0,0 +1,94 @@
+class VarHeap:
+    """Binary max-heap of integer keys ordered by an external score list.
+
+    `scores` is shared with the owner of the heap and indexed by key, so
+    literal-indexed lists (negative literals wrapping around from the end)
+    work as well as variable-indexed ones. After changing the score of a key
+    that is in the heap, call `increased`, `decreased` or `update` so it
+    moves to its new place in O(log n).
+    """
+
+    def __init__(self, scores, keys=()):
+        self.scores = scores
+        self.heap = []
+        self.positions = [-1] * len(scores)
+        for key in keys:
+            self.push(key)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __contains__(self, key):
+        return self.positions[key] >= 0
+
+    def top(self):
+        return self.heap[0]
+
+    def push(self, key):
+        if self.positions[key] >= 0:
+            return
+        self.heap.append(key)
+        self._sift_up(len(self.heap) - 1)
+
+    def pop(self):
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        self.positions[top] = -1
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        return top
+
+    def increased(self, key):
+        if self.positions[key] >= 0:
+            self._sift_up(self.positions[key])
+
+    def decreased(self, key):
+        if self.positions[key] >= 0:
+            self._sift_down(self.positions[key])
+
+    def update(self, key):
+        if self.positions[key] >= 0:
+            self._sift_up(self.positions[key])
+            self._sift_down(self.positions[key])
+
+    def _sift_up(self, i):
+        heap = self.heap
+        positions = self.positions
+        scores = self.scores
+        key = heap[i]
+        score = scores[key]
+        while i:
+            parent = (i - 1) >> 1
+            above = heap[parent]
+            if scores[above] >= score:
+                break
+            heap[i] = above
+            positions[above] = i
+            i = parent
+        heap[i] = key
+        positions[key] = i
+
+    def _sift_down(self, i):
+        heap = self.heap
+        positions = self.positions
+        scores = self.scores
+        size = len(heap)
+        key = heap[i]
+        score = scores[key]
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            right = child + 1
+            if right < size and scores[heap[right]] > scores[heap[child]]:
+                child = right
+            below = heap[child]
+            if scores[below] <= score:
+                break
+            heap[i] = below
+            positions[below] = i
+            i = child
+        heap[i] = key
+        positions[key] = i
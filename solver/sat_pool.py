@@ -0,0 +1,372 @@
+import os
+import re
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+from sat_reader import is_cnf_file
+from sat_cache import read_dimacs_cached
+from sat_clausedb import ClauseStore
+from sat_shared import SharedClauses, attached
+
+
+def timed_call(solver, clauses):
+    """Runs solver(clauses) in a worker; returns (result, wall, cpu) of the solve itself."""
+    with attached(clauses) as clauses:
+        wall, cpu = time.perf_counter(), time.process_time()
+        result = solver(clauses)
+        return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def ready(solver):
+    """Handshake task: by the time it runs, unpickling solver has imported its modules."""
+    return True
+
+
+class SolverPool:
+    """A warm spawn worker that is reused for timed solver runs.
+
+    A fresh Pool(1) per instance pays interpreter start-up and module
+    imports on every file. Here the worker stays up between runs and is
+    only replaced after a timeout, when killing it is the only way to stop
+    the solver. The replacement is started right away, and before a solver
+    first runs on a worker a handshake waits, without a deadline, until the
+    worker is up and has imported it, so neither counts against the next
+    timeout. Solve time is measured inside the worker, so it excludes
+    process start-up and the transfer of the clauses. A ClauseStore is
+    handed over through shared memory instead of being pickled.
+    """
+
+    def __init__(self, cache=None):
+        self.context = multiprocessing.get_context("spawn")
+        self.pool = None
+        self.warmed = set()  # solvers the current worker has imported
+        self.cache = cache
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def run(self, solver, clauses, timeout):
+        """Returns (result, elapsed, status); status is 'timeout' or None.
+
+        With a ResultCache, a run it can answer does not reach the worker,
+        and the outcome of every other run is stored in it.
+        """
+        if self.cache is None:
+            result, elapsed, _, status = self.solve(solver, clauses, timeout)
+            return result, elapsed, status
+        key = self.cache.key(solver, clauses)
+        cached = self.cache.get(key, timeout)
+        if cached is not None:
+            result, elapsed, _, status = cached
+            return result, elapsed, status
+        result, elapsed, cpu, status = self.solve(solver, clauses, timeout)
+        self.cache.put(key, result, elapsed, cpu, status, timeout)
+        return result, elapsed, status
+
+    def solve(self, solver, clauses, timeout):
+        """Like run, without the cache and with the CPU time: (result, elapsed, cpu, status)."""
+        if self.pool is None:
+            self.start()
+        if solver not in self.warmed:
+            self.pool.apply(ready, (solver,))
+            self.warmed.add(solver)
+        shared = SharedClauses(clauses) if isinstance(clauses, ClauseStore) else None
+        try:
+            async_result = self.pool.apply_async(timed_call, (solver, shared or clauses))
+            try:
+                result, elapsed, cpu = async_result.get(timeout=timeout)
+            except multiprocessing.TimeoutError:
+                self.recycle()
+                return None, None, None, 'timeout'
+            return result, elapsed, cpu, None
+        finally:
+            if shared is not None:
+                shared.unlink()
+
+    def start(self):
+        self.pool = self.context.Pool(1)
+        self.warmed = set()
+
+    def recycle(self):
+        self.pool.terminate()
+        self.pool.join()
+        self.start()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+
+def serve(conn):
+    """Worker loop for Scheduler: solves (solver, clauses) tasks until it gets None.
+
+    Once a task is unpickled (importing its solver) and its clauses are
+    attached, None is sent to say the solve is starting.
+    """
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+        solver, clauses = task
+        try:
+            with attached(clauses) as clauses:
+                conn.send(None)
+                wall, cpu = time.perf_counter(), time.process_time()
+                result = solver(clauses)
+                wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        except Exception as e:
+            conn.send((f"{type(e).__name__}: {e}", None, None, 'error'))
+            continue
+        conn.send((result, wall, cpu, None))
+
+
+class Scheduler:
+    """Runs solver tasks concurrently on a fixed number of spawn workers.
+
+    Each task gets its own deadline, counted from the moment its worker
+    reports that the solve is starting, so spawning a worker, importing the
+    solver and attaching the clauses are not charged to it. A worker that
+    misses the deadline is killed and replaced without disturbing the
+    others; the rest are reused from task to task like SolverPool's. Wall
+    and CPU time are both measured inside the worker.
+
+    A ClauseStore is copied into shared memory once, however many tasks
+    use it (a portfolio or a set of cubes runs many on the same store), and
+    the segment is freed when the last of them finishes.
+    """
+
+    def __init__(self, workers=None):
+        self.context = multiprocessing.get_context("spawn")
+        self.size = workers or os.cpu_count() or 1
+        self.idle = []
+        self.busy = {}  # connection -> (process, key, deadline, clauses, timeout)
+        self.shared = {}  # id(store) -> [store, SharedClauses, tasks using it]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self):
+        conn, child = self.context.Pipe()
+        process = self.context.Process(target=serve, args=(child,), daemon=True)
+        process.start()
+        child.close()
+        return process, conn
+
+    def run(self, tasks):
+        """Runs (key, solver, clauses, timeout) tasks in the order given.
+
+        Yields (key, result, wall, cpu, status) as tasks finish, where status
+        is 'timeout', 'error' (result then holds the message) or None. A
+        timeout of None means no deadline. tasks may be a generator; it is
+        only advanced when a worker is free, so clauses are loaded just
+        before they are needed.
+        """
+        tasks = iter(tasks)
+        while True:
+            while len(self.busy) < self.size:
+                task = next(tasks, None)
+                if task is None:
+                    break
+                key, solver, clauses, timeout = task
+                process, conn = self.idle.pop() if self.idle else self.start()
+                conn.send((solver, self.share(clauses)))
+                # No deadline until the worker says the solve has started
+                self.busy[conn] = (process, key, float('inf'), clauses, timeout)
+            if not self.busy:
+                return
+
+            nearest = min(deadline for _, _, deadline, _, _ in self.busy.values())
+            wait_time = max(0, nearest - time.monotonic()) if nearest != float('inf') else None
+            for conn in wait(list(self.busy), timeout=wait_time):
+                process, key, _, clauses, timeout = self.busy.pop(conn)
+                try:
+                    message = conn.recv()
+                except EOFError:  # the worker died, e.g. out of memory
+                    self.release(clauses)
+                    self.discard(process, conn)
+                    yield key, f"worker exited with code {process.exitcode}", None, None, 'error'
+                    continue
+                if message is None:
+                    deadline = time.monotonic() + timeout if timeout is not None else float('inf')
+                    self.busy[conn] = (process, key, deadline, clauses, timeout)
+                    continue
+                self.release(clauses)
+                self.idle.append((process, conn))
+                result, wall, cpu, status = message
+                yield key, result, wall, cpu, status
+
+            now = time.monotonic()
+            for conn, (process, key, deadline, clauses, _) in list(self.busy.items()):
+                if deadline <= now:
+                    del self.busy[conn]
+                    self.discard(process, conn)
+                    self.release(clauses)
+                    yield key, None, None, None, 'timeout'
+
+    def share(self, clauses):
+        if not isinstance(clauses, ClauseStore):
+            return clauses
+        entry = self.shared.get(id(clauses))
+        if entry is None:
+            entry = self.shared[id(clauses)] = [clauses, SharedClauses(clauses), 0]
+        entry[2] += 1
+        return entry[1]
+
+    def release(self, clauses):
+        entry = self.shared.get(id(clauses))
+        if entry is None:
+            return
+        entry[2] -= 1
+        if not entry[2]:
+            del self.shared[id(clauses)]
+            entry[1].unlink()
+
+    def cancel(self):
+        """Abandons the unfinished tasks of a run the caller stopped reading.
+
+        Only their workers are killed, and replacements are started at once;
+        idle workers are kept warm for the next run.
+        """
+        for conn, (process, _, _, clauses, _) in self.busy.items():
+            self.discard(process, conn)
+            self.release(clauses)
+            self.idle.append(self.start())
+        self.busy = {}
+
+    def discard(self, process, conn):
+        process.terminate()
+        process.join()
+        conn.close()
+
+    def close(self):
+        for process, conn in self.idle:
+            conn.send(None)
+            process.join()
+            conn.close()
+        for conn, (process, _, _, _, _) in self.busy.items():
+            self.discard(process, conn)
+        for _, shared, _ in self.shared.values():
+            shared.unlink()
+        self.idle = []
+        self.busy = {}
+        self.shared = {}
+
+
+def cnf_tasks(folder_paths, max_files=None):
+    """(folder_path, filename) for the first max_files CNF files of each folder.
+
+    The files are ordered largest first across all folders, file size
+    standing in for the expected solve time, so the slowest instances start
+    early and the end of a run is not one long straggler.
+    """
+    files = []
+    for folder_path in folder_paths:
+        cnf_files = sorted(f for f in os.listdir(folder_path) if is_cnf_file(f))
+        if max_files:
+            cnf_files = cnf_files[:max_files]
+        files.extend((folder_path, filename) for filename in cnf_files)
+    files.sort(key=lambda item: os.path.getsize(os.path.join(*item)), reverse=True)
+    return files
+
+
+def benchmark_folders(solver, folder_paths, timeout, max_files=None, workers=None, counters=None, cache=None):
+    """Benchmarks solver on the CNF files of several folders at once.
+
+    Returns {folder_path: stats} where stats holds files_processed, timeouts,
+    avg_time (wall) and avg_cpu_time over the files that did not time out.
+    counters maps extra stat names to functions of a solver result whose
+    values are summed per folder. Files that fail to load or solve are
+    reported and skipped. With a ResultCache, files it can answer are not
+    solved again, and new results are added to it.
+    """
+    counters = counters or {}
+    totals = {path: {'files_processed': 0, 'timeouts': 0, 'wall': 0, 'cpu': 0} for path in folder_paths}
+    for stats in totals.values():
+        stats.update(dict.fromkeys(counters, 0))
+    keys = {}
+    stores = {}  # closed once their task is done, which unmaps cached instances
+
+    def record(folder_path, filename, result, wall, cpu, status, note=""):
+        stats = totals[folder_path]
+        if status == 'error':
+            print(f"⚠️ Skipped due to error: {filename} — {result}")
+            return
+        stats['files_processed'] += 1
+        if status == 'timeout':
+            print(f"⏱️ {filename}: Timeout (> {timeout}s){note}")
+            stats['timeouts'] += 1
+            return
+        print(f"🔍 {filename}: {wall:.2f}s wall, {cpu:.2f}s CPU{note}")
+        stats['wall'] += wall
+        stats['cpu'] += cpu
+        for name, count in counters.items():
+            stats[name] += count(result)
+
+    def tasks():
+        for folder_path, filename in cnf_tasks(folder_paths, max_files):
+            try:
+                _, _, clauses = read_dimacs_cached(os.path.join(folder_path, filename))
+            except Exception as e:
+                print(f"⚠️ Skipped due to error: {filename} — {e}")
+                continue
+            if cache is not None:
+                key = keys[folder_path, filename] = cache.key(solver, clauses)
+                cached = cache.get(key, timeout)
+                if cached is not None:
+                    record(folder_path, filename, *cached, note=" (cached)")
+                    clauses.close()
+                    continue
+            stores[folder_path, filename] = clauses
+            yield (folder_path, filename), solver, clauses, timeout
+
+    with Scheduler(workers) as scheduler:
+        for (folder_path, filename), result, wall, cpu, status in scheduler.run(tasks()):
+            record(folder_path, filename, result, wall, cpu, status)
+            stores.pop((folder_path, filename)).close()
+            if cache is not None:
+                cache.put(keys.pop((folder_path, filename)), result, wall, cpu, status, timeout)
+
+    results = {}
+    for folder_path, stats in totals.items():
+        solved = stats['files_processed'] - stats['timeouts']
+        results[folder_path] = {
+            "files_processed": stats['files_processed'],
+            "timeouts": stats['timeouts'],
+            "avg_time": stats['wall'] / solved if solved else 0,
+            "avg_cpu_time": stats['cpu'] / solved if solved else 0,
+            **{name: stats[name] for name in counters}
+        }
+    return results
+
+
+def benchmark_subfolders(solver, base_path, timeout, max_files_per_folder=None, workers=None, counters=None,
+                         cache=None):
+    """benchmark_folders over every sub-folder of base_path, keyed by variable count.
+
+    The variable count is the first number in the folder name; folders
+    without one are reported and skipped. All folders share one Scheduler,
+    so no core idles at a folder boundary.
+    """
+    folders = {}
+    for folder in os.listdir(base_path):
+        folder_path = os.path.join(base_path, folder)
+        if not os.path.isdir(folder_path):
+            continue
+
+        match = re.search(r'\d+', folder)
+        if match:
+            folders[folder_path] = int(match.group())
+        else:
+            print(f"⚠️ Could not parse variable count from '{folder}'")
+
+    print(f"\n⏳ Benchmarking {len(folders)} folders")
+    stats = benchmark_folders(solver, list(folders), timeout, max_files_per_folder, workers, counters, cache)
+    return {folders[path]: stats[path] for path in folders}
@@ -0,0 +1,64 @@
+from sat_reader import read_dimacs_store, is_cnf_file
+from sat_pool import Scheduler
+from sat_dpll import dpll
+from sat_dpll_jw import dpll_jw
+from sat_dpll_most_freq import dpll as dpll_mf
+from sat_dp import dp_algorithm
+import os
+
+# Complete procedures whose strengths differ by instance family
+PORTFOLIO = {
+    'DPLL': dpll,
+    'DPLL-JW': dpll_jw,
+    'DPLL-MF': dpll_mf,
+    'DP': dp_algorithm
+}
+
+
+def portfolio(clauses, solvers=None, timeout=None, scheduler=None):
+    """Races several solvers on one instance in parallel processes.
+
+    Returns (is_sat, winner, elapsed) for the first solver to answer;
+    the others are killed at once. If every solver fails or runs out of
+    time, returns (None, None, None). Pass a Scheduler with a worker per
+    solver to reuse warm workers across instances; only the workers of the
+    losing solvers are then replaced.
+    """
+    solvers = solvers or PORTFOLIO
+    if scheduler is None:
+        with Scheduler(len(solvers)) as scheduler:
+            return portfolio(clauses, solvers, timeout, scheduler)
+    tasks = ((name, solver, clauses, timeout) for name, solver in solvers.items())
+    try:
+        for name, result, wall, _, status in scheduler.run(tasks):
+            if status is None:
+                return result, name, wall
+    finally:
+        scheduler.cancel()
+    return None, None, None
+
+
+def process_all_files(directory_path, timeout=60):
+    scheduler = Scheduler(len(PORTFOLIO))  # one set of warm workers for the whole folder
+    for filename in os.listdir(directory_path):
+        if is_cnf_file(filename):
+            file_path = os.path.join(directory_path, filename)
+            print(f"Processing file: {filename}")
+
+            try:
+                num_vars, num_clauses, clauses = read_dimacs_store(file_path)
+
+                is_sat, winner, elapsed = portfolio(clauses, timeout=timeout, scheduler=scheduler)
+                if winner is None:
+                    print(f"{filename}: Timeout (> {timeout}s) — Skipping")
+                else:
+                    print(f"{filename}: {'SAT' if is_sat else 'UNSAT'} — {elapsed:.2f}s ({winner})")
+
+            except Exception as e:
+                print(f"{filename}: Error — {e}")
+    scheduler.close()
+
+
+if __name__ == "__main__":
+    directory_path = 'C:\\Users\\andre\\SAT-Solver\\cnfs\\50-250\\uf100-430'
+    process_all_files(directory_path)
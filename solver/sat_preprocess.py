@@ -0,0 +1,217 @@
+import functools
+from sat_clausedb import ClauseStore
+from sat_dp import OccurrenceIndex, merge_resolvents
+
+
+def subsumption_check(c, d):
+    """True if c subsumes d, the literal of d that c strengthens away, or None.
+
+    c strengthens d by self-subsuming resolution when c = R + l and
+    d contains R and -l: resolving them on l gives d without -l.
+    """
+    diff = c - d
+    if not diff:
+        return True
+    if len(diff) == 1:
+        (lit,) = diff
+        if -lit in d:
+            return -lit
+    return None
+
+
+class Preprocessor:
+    """Simplifies a CNF before search and maps models back to it.
+
+    `simplify` runs unit propagation, pure literal removal, subsumption,
+    self-subsuming strengthening and bounded variable elimination (BVE) to
+    a fixpoint. BVE replaces the clauses of a variable by their non
+    tautological resolvents, like one DP step, but only when that does not
+    grow the formula by more than `growth` clauses and the variable has at
+    most `occurrence_limit` clauses.
+
+    Every variable that leaves the formula is pushed onto `stack` together
+    with the clauses removed with it. `extend` replays the stack backwards
+    to turn a model of the simplified formula into one of the original.
+    """
+
+    def __init__(self, clauses, growth=0, occurrence_limit=16, max_rounds=5):
+        self.clauses = clauses
+        self.growth = growth
+        self.occurrence_limit = occurrence_limit
+        self.max_rounds = max_rounds
+        self.stack = []  # (variable, clauses removed with it), in removal order
+        self.num_vars = 0
+        self.index = None
+        self.stats = {'units': 0, 'pure': 0, 'eliminated': 0, 'subsumed': 0, 'strengthened': 0}
+
+    def simplify(self):
+        """Returns the simplified formula as a ClauseStore, or None if UNSAT."""
+        clauses = {frozenset(clause) for clause in self.clauses}
+        if frozenset() in clauses:
+            return None
+        # Counted before tautologies go, so extend assigns their variables too
+        self.num_vars = max((abs(lit) for c in clauses for lit in c), default=0)
+        clauses = [c for c in clauses if not any(-lit in c for lit in c)]
+        # Units are propagated here as they appear, so the index need not queue them
+        self.index = index = OccurrenceIndex(clauses, self.num_vars, queue_units=False)
+
+        if not self.propagate([lit for c in clauses if len(c) == 1 for lit in c]):
+            return None
+        for _ in range(self.max_rounds):
+            removed = len(self.stack)
+            size = len(index)
+            if not self.subsume(list(index.clauses)):
+                return None
+            self.remove_pure()
+            if not self.eliminate():
+                return None
+            if len(self.stack) == removed and len(index) == size:
+                break
+        return ClauseStore.from_clauses(index.clauses.values(), self.num_vars)
+
+    def propagate(self, units):
+        """Assigns unit literals at the root; returns False on a conflict."""
+        index = self.index
+        occurrences = index.occurrences
+        while units:
+            lit = units.pop()
+            if not index.occurs(abs(lit)):
+                continue  # already assigned
+            self.stack.append((abs(lit), [frozenset((lit,))]))
+            self.stats['units'] += 1
+            for cid in list(occurrences[lit]):
+                index.remove(cid)
+            for cid in list(occurrences[-lit]):
+                clause = index.remove(cid) - {-lit}
+                if not clause:
+                    return False
+                index.add(clause)
+                if len(clause) == 1:
+                    units.extend(clause)
+        return True
+
+    def remove_pure(self):
+        index = self.index
+        occurrences = index.occurrences
+        for lit in [lit for lit, ids in occurrences.items() if ids and not occurrences.get(-lit)]:
+            removed = [index.remove(cid) for cid in list(occurrences[lit])]
+            if removed:
+                self.stack.append((abs(lit), removed))
+                self.stats['pure'] += 1
+
+    def subsume(self, ids):
+        """Backward subsumption and strengthening with each clause in ids.
+
+        Any clause d that c subsumes or strengthens contains c's variable
+        with the fewest occurrences, in one polarity or the other, so only
+        those clauses are checked. Strengthened clauses are queued again.
+        Returns False if strengthening produced a conflict.
+        """
+        index = self.index
+        clauses = index.clauses
+        occurrences = index.occurrences
+        queue = sorted(ids, key=lambda cid: -len(clauses[cid]))
+        while queue:
+            cid = queue.pop()
+            if cid not in clauses:
+                continue
+            c = clauses[cid]
+            pivot = min(c, key=lambda lit: len(occurrences[lit]) + len(occurrences[-lit]))
+            for did in list(occurrences[pivot] | occurrences[-pivot]):
+                if did == cid or did not in clauses or len(clauses[did]) < len(c):
+                    continue
+                result = subsumption_check(c, clauses[did])
+                if result is None:
+                    continue
+                d = index.remove(did)
+                if result is True:
+                    self.stats['subsumed'] += 1
+                    continue
+                self.stats['strengthened'] += 1
+                d = d - {result}
+                queue.append(index.add(d))
+                if len(d) == 1 and not self.propagate(list(d)):
+                    return False
+                if cid not in clauses:
+                    break  # c was satisfied by the new unit
+        return True
+
+    def eliminate(self):
+        """One BVE pass over the variables, cheapest pos × neg first.
+
+        Returns False if an elimination derived the empty clause.
+        """
+        index = self.index
+        occurrences = index.occurrences
+        candidates = sorted((var for var in range(1, self.num_vars + 1) if index.occurs(var)), key=index.cost)
+        for var in candidates:
+            pos_ids = list(occurrences[var])
+            neg_ids = list(occurrences[-var])
+            if not pos_ids or not neg_ids or len(pos_ids) + len(neg_ids) > self.occurrence_limit:
+                continue
+            budget = len(pos_ids) + len(neg_ids) + self.growth
+            resolvents = set()
+            for c1 in (index.clauses[i] for i in pos_ids):
+                for c2 in (index.clauses[i] for i in neg_ids):
+                    resolvent = (c1 | c2) - {var, -var}
+                    if not any(-lit in resolvent for lit in resolvent):
+                        resolvents.add(resolvent)
+                if len(resolvents) > budget:
+                    break
+            if len(resolvents) > budget:
+                continue
+
+            self.stack.append((var, [index.remove(i) for i in pos_ids + neg_ids]))
+            self.stats['eliminated'] += 1
+            if not merge_resolvents(index, resolvents, self.stats):
+                return False
+            if not self.propagate([lit for r in resolvents if len(r) == 1 for lit in r]):
+                return False
+        return True
+
+    def extend(self, model):
+        """Extends a model of the simplified formula to the original variables.
+
+        `model` is an iterable of true literals; variables it leaves out are
+        taken as false. Removed variables are restored in reverse order, each
+        set true exactly when one of its saved positive clauses is not yet
+        satisfied. Both polarities cannot be needed at once, or the
+        resolvent of the two clauses would be false as well.
+        """
+        true = set(model)
+        for var in range(1, self.num_vars + 1):
+            if var not in true:
+                true.add(-var)
+        for var, clauses in reversed(self.stack):
+            true.discard(var)
+            true.discard(-var)
+            if any(var in c and true.isdisjoint(c) for c in clauses):
+                true.add(var)
+            else:
+                true.add(-var)
+        return sorted(true, key=abs)
+
+
+def solve_preprocessed(solver, clauses, model=False):
+    """solver on the preprocessed clauses, its result passed through as is.
+
+    With model=True, solver(clauses, model=True) must return (is_sat, model)
+    and the model is extended to the original formula before returning.
+    """
+    preprocessor = Preprocessor(clauses)
+    simplified = preprocessor.simplify()
+    if not model:
+        return False if simplified is None else solver(simplified)
+    if simplified is None:
+        return False, None
+    is_sat, found = solver(simplified, model=True)
+    return is_sat, preprocessor.extend(found) if is_sat else None
+
+
+def with_preprocessing(solver, model=False):
+    """Wraps a solver entry point so it runs on the preprocessed formula.
+
+    The result is a functools.partial of module-level functions, so it can
+    be sent to spawn-based worker processes like the solvers themselves.
+    """
+    return functools.partial(solve_preprocessed, solver, model=model)
@@ -0,0 +1,187 @@
+class Propagator:
+    """Unit propagation with two watched literals per clause.
+
+    Values are kept in a list indexed directly by literal (negative literals
+    wrap around from the end of the list), so a lookup never needs abs().
+    The first two literals of every clause are its watches: assigning a
+    literal only visits the clauses watching its negation. The trail doubles
+    as the propagation queue, `head` points at the next literal to process.
+
+    Search works in place on this single clause database: `decide` opens a
+    new decision level and `backtrack` unwinds the trail, so a branch costs
+    only the literals it assigns.
+    """
+
+    def __init__(self, clauses, num_vars=None):
+        clauses = [list(dict.fromkeys(clause)) for clause in clauses]
+        if num_vars is None:
+            num_vars = max((abs(lit) for clause in clauses for lit in clause), default=0)
+
+        self.num_vars = num_vars
+        self.values = [0] * (2 * num_vars + 1)
+        self.watches = [[] for _ in range(2 * num_vars + 1)]
+        self.clauses = clauses
+        self.trail = []
+        self.level_starts = []  # trail position of every decision
+        self.level_of = [0] * (num_vars + 1)
+        self.reasons = [None] * (num_vars + 1)  # implying clause index per variable
+        self.head = 0
+        self.conflict = None  # index of a clause falsified at the root, if any
+
+        for index, clause in enumerate(clauses):
+            if len(clause) >= 2:
+                self.watches[clause[0]].append(index)
+                self.watches[clause[1]].append(index)
+            elif not clause or not self.assign(clause[0]):
+                self.conflict = index
+
+    @property
+    def decision_level(self):
+        return len(self.level_starts)
+
+    def value(self, literal):
+        return self.values[literal]
+
+    def assign(self, literal, reason=None):
+        """Puts `literal` on the trail; returns False if it is already false."""
+        value = self.values[literal]
+        if value:
+            return value == 1
+        self.values[literal] = 1
+        self.values[-literal] = -1
+        var = abs(literal)
+        self.level_of[var] = len(self.level_starts)
+        self.reasons[var] = reason
+        self.trail.append(literal)
+        return True
+
+    def add_clause(self, clause):
+        """Appends a clause watching its first two literals; returns its index.
+
+        The caller is responsible for choosing watches that are consistent
+        with the current trail (e.g. the asserting literal of a learned clause
+        first and its highest-level false literal second).
+        """
+        index = len(self.clauses)
+        self.clauses.append(clause)
+        if len(clause) >= 2:
+            self.watches[clause[0]].append(index)
+            self.watches[clause[1]].append(index)
+        return index
+
+    def remove_clauses(self, indices):
+        """Detaches clauses that are not the reason of any current assignment.
+
+        Indices stay reserved so the others keep theirs; a removed slot
+        holds None.
+        """
+        removed = set(indices)
+        watched = {lit for index in removed for lit in self.clauses[index][:2]}
+        for lit in watched:
+            self.watches[lit] = [index for index in self.watches[lit] if index not in removed]
+        for index in removed:
+            self.clauses[index] = None
+
+    def decide(self, literal):
+        self.level_starts.append(len(self.trail))
+        self.assign(literal)
+
+    def backtrack(self, level):
+        """Unassigns everything above decision `level`; returns the removed literals."""
+        if level >= len(self.level_starts):
+            return []
+        start = self.level_starts[level]
+        del self.level_starts[level:]
+
+        removed = self.trail[start:]
+        del self.trail[start:]
+        values = self.values
+        for lit in removed:
+            values[lit] = 0
+            values[-lit] = 0
+        self.head = start
+        return removed
+
+    def propagate(self):
+        """Propagates the queued literals; returns a falsified clause index or None."""
+        if self.conflict is not None:
+            return self.conflict
+
+        values = self.values
+        watches = self.watches
+        clauses = self.clauses
+        trail = self.trail
+        level_of = self.level_of
+        reasons = self.reasons
+        level = len(self.level_starts)
+
+        while self.head < len(trail):
+            false_lit = -trail[self.head]
+            self.head += 1
+            watching = watches[false_lit]
+            kept = 0
+            i = 0
+            count = len(watching)
+
+            while i < count:
+                index = watching[i]
+                i += 1
+                clause = clauses[index]
+
+                # Keep the falsified watch in position 1; position 0 then
+                # holds the implied literal if the clause becomes unit
+                other = clause[0]
+                if other == false_lit:
+                    other = clause[1]
+                    clause[0] = other
+                    clause[1] = false_lit
+
+                if values[other] == 1:
+                    watching[kept] = index
+                    kept += 1
+                    continue
+
+                for k in range(2, len(clause)):
+                    lit = clause[k]
+                    if values[lit] != -1:
+                        clause[1] = lit
+                        clause[k] = false_lit
+                        watches[lit].append(index)
+                        break
+                else:
+                    watching[kept] = index
+                    kept += 1
+                    if values[other] == -1:
+                        del watching[kept:i]
+                        self.head = len(trail)
+                        return index
+                    values[other] = 1
+                    values[-other] = -1
+                    var = other if other > 0 else -other
+                    level_of[var] = level
+                    reasons[var] = index
+                    trail.append(other)
+
+            del watching[kept:]
+
+        return None
+
+    def model(self):
+        """The assigned literals; after a search that found every clause satisfied, a model."""
+        return list(self.trail)
+
+    def open_clauses(self):
+        """Yields every unsatisfied clause restricted to its unassigned literals."""
+        values = self.values
+        for clause in self.clauses:
+            if clause is None:
+                continue
+            remaining = []
+            for lit in clause:
+                value = values[lit]
+                if value == 1:
+                    break
+                if not value:
+                    remaining.append(lit)
+            else:
+                yield remaining
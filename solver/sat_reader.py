@@ -1,22 +1,156 @@
-def read_dimacs_cnf(file_path):
-    clauses = []
+import os
+import re
+import bz2
+import gzip
+import lzma
+from itertools import chain
+from array import array
+from sat_clausedb import ClauseStore
+
+try:
+    import numpy as np
+except ImportError:  # optional, the pure-Python tokenizer is used instead
+    np = None
+
+HEADER = re.compile(rb'^p\s+cnf\s+(\d+)\s+(\d+)', re.M)
+COMMENTS = re.compile(rb'^[ \t]*c.*$', re.M)
+LITERAL_LIMIT = 2 ** 31 - 1  # literals and their negations are stored as int32
+CNF_EXTENSIONS = ('.cnf', '.cnf.gz', '.cnf.bz2', '.cnf.xz')
+OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.xz': lzma.open}
+
+
+def is_cnf_file(filename):
+    return filename.endswith(CNF_EXTENSIONS)
+
+
+def open_cnf(file_path):
+    """Opens a CNF file for binary reading, decompressing on the fly.
+
+    .gz, .bz2 and .xz files are decoded by their stream readers as they
+    are read, so no uncompressed copy is ever written to disk.
+    """
+    opener = OPENERS.get(os.path.splitext(file_path)[1], open)
+    return opener(file_path, 'rb')
+
+
+def parse_dimacs(data):
+    """Parses DIMACS CNF text (bytes) into (num_vars, num_clauses, ClauseStore).
 
-    with open(file_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line == '' or line.startswith('c') or line.startswith('%') or line == '0':
-                continue  # skip comments and end markers
+    The whole text is tokenized at once and split into clauses at the 0
+    terminators, so a clause may span any number of lines. Comment lines
+    are dropped, and so is everything from a '%' line on (the SATLIB
+    trailer). A 0 with no literals before it (a bare '0' line, or the
+    '0' that follows some trailers) ends no clause. If there is no header,
+    the counts are taken from the clauses. A literal that does not fit in
+    int32 raises ValueError rather than being wrapped.
+    """
+    header = HEADER.search(data)
+    if header:
+        data = data[header.end():]  # only comments may precede the header
+    trailer = data.find(b'\n%')
+    if trailer >= 0:
+        data = data[:trailer]
+    if b'c' in data:
+        data = COMMENTS.sub(b'', data)
 
-            if line.startswith('p'):
-                parts = line.split()
-                num_vars = int(parts[2])
-                num_clauses = int(parts[3])
-                continue
+    if np is not None:
+        if data.isspace():
+            data = b''  # fromstring reads blank text as a single 0
+        values = np.fromstring(data, dtype=np.int64, sep=' ')
+        if len(values) and np.abs(values).max() > LITERAL_LIMIT:
+            raise ValueError("literal out of int32 range")
+        if len(values) and values[-1]:
+            values = np.append(values, np.int64(0))  # unterminated last clause
+        zeros = np.flatnonzero(values == 0)
+        literals = array('i', values[values != 0].astype(np.int32).tobytes())
+        ends = zeros - np.arange(len(zeros))
+        ends = ends[np.diff(ends, prepend=0) > 0]  # drop empty clauses
+        offsets = array('i', [0])
+        offsets.frombytes(ends.astype(np.int32).tobytes())
+    else:
+        values = list(map(int, data.split()))
+        if values and values[-1]:
+            values.append(0)  # unterminated last clause
+        try:
+            literals = array('i', filter(None, values))
+        except OverflowError:
+            literals = None
+        if literals is None or (literals and min(literals) < -LITERAL_LIMIT):
+            raise ValueError("literal out of int32 range")
+        offsets = array('i', [0])
+        end = -1
+        for k in range(values.count(0)):
+            # Clause k ends at the k-th zero; subtracting k skips the earlier zeros
+            end = values.index(0, end + 1)
+            if end - k > offsets[-1]:
+                offsets.append(end - k)
 
-            literals = list(map(int, line.split()))
-            if literals[-1] == 0:
-                literals.pop()  # remove ending 0
+    store = ClauseStore(literals, offsets, int(header.group(1)) if header else None)
+    num_clauses = int(header.group(2)) if header else len(store)
+    return store.num_vars, num_clauses, store
 
-            clauses.append(frozenset(literals))  # <-- this line changed
 
-    return num_vars, num_clauses, clauses
+def stream_dimacs(lines):
+    """Streaming fallback: yields clauses as tuples from an iterable of lines.
+
+    Literals are collected across lines until a 0, so clauses split over
+    several lines come out whole; comment, header and '%' lines and empty
+    clauses are handled like in parse_dimacs.
+    """
+    clause = []
+    for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode('ascii')
+        line = line.strip()
+        if not line or line[0] in 'cp':
+            continue
+        if line[0] == '%':
+            break
+        for token in line.split():
+            lit = int(token)
+            if lit:
+                clause.append(lit)
+            elif clause:
+                yield tuple(clause)
+                clause = []
+    if clause:
+        yield tuple(clause)
+
+
+def stream_store(lines):
+    """Like parse_dimacs, but reads the clauses from stream_dimacs."""
+    lines = iter(lines)
+    header = None
+    for line in lines:
+        header = HEADER.match(line.lstrip())
+        if header:
+            break
+        if line.strip() and not line.startswith(b'c'):
+            lines = chain([line], lines)  # no header, this is a clause
+            break
+    try:
+        store = ClauseStore.from_clauses(stream_dimacs(lines), int(header.group(1)) if header else None)
+    except OverflowError:
+        store = None
+    if store is None or (store.literals and min(store.literals) < -LITERAL_LIMIT):
+        raise ValueError("literal out of int32 range")
+    num_clauses = int(header.group(2)) if header else len(store)
+    return store.num_vars, num_clauses, store
+
+
+def read_dimacs_store(file_path):
+    """Reads a (possibly compressed) DIMACS file straight into a ClauseStore.
+
+    Plain files are read whole and parsed in bulk when NumPy is available.
+    Compressed files, and any file without NumPy, are decoded and parsed
+    line by line, so the uncompressed text is never held in memory at once.
+    """
+    with open_cnf(file_path) as f:
+        if np is None or os.path.splitext(file_path)[1] in OPENERS:
+            return stream_store(f)
+        return parse_dimacs(f.read())
+
+
+def read_dimacs_cnf(file_path):
+    num_vars, num_clauses, store = read_dimacs_store(file_path)
+    return num_vars, num_clauses, [frozenset(clause) for clause in store]
@@ -0,0 +1,145 @@
+import os
+import sys
+import time
+import types
+import pickle
+import sqlite3
+import hashlib
+import functools
+from array import array
+
+RESULTS_PATH = os.environ.get('SAT_RESULT_CACHE',
+                              os.path.join(os.path.expanduser('~'), '.cache', 'sat-solver', 'results.sqlite'))
+SOLVER_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    solver TEXT NOT NULL,
+    status TEXT,
+    verdict INTEGER,
+    result BLOB,
+    time REAL,
+    cpu_time REAL,
+    timeout REAL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+
+def formula_hash(clauses):
+    """Hash of a formula that ignores literal order, clause order and duplicates."""
+    canonical = sorted({tuple(sorted(set(clause))) for clause in clauses})
+    digest = hashlib.blake2b(digest_size=16)
+    for clause in canonical:
+        digest.update(array('i', clause).tobytes())
+        digest.update(b'\0\0\0\0')
+    return digest.hexdigest()
+
+
+def module_sources(module_name, found):
+    """Collects the solver-directory modules module_name depends on, transitively."""
+    module = sys.modules.get(module_name)
+    path = getattr(module, '__file__', None)
+    if module_name in found or module_name == '__main__' or not path \
+            or os.path.dirname(os.path.abspath(path)) != SOLVER_DIR:
+        return
+    found[module_name] = path
+    for value in vars(module).values():
+        if isinstance(value, types.ModuleType):
+            module_sources(value.__name__, found)
+        elif isinstance(getattr(value, '__module__', None), str):
+            module_sources(value.__module__, found)
+
+
+@functools.lru_cache(maxsize=None)
+def solver_version(module_name):
+    """Hash of the sources behind a solver, so editing any of them invalidates its results."""
+    found = {}
+    module_sources(module_name, found)
+    digest = hashlib.blake2b(digest_size=8)
+    for name in sorted(found):
+        with open(found[name], 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def describe_solver(solver):
+    """Name, version and configuration of a solver, e.g. for partial(cdcl, restarts='luby')."""
+    if isinstance(solver, functools.partial):
+        args = [describe_solver(arg) for arg in solver.args]
+        args += [f"{name}={describe_solver(value)}" for name, value in sorted(solver.keywords.items())]
+        return f"{describe_solver(solver.func)}({', '.join(args)})"
+    if callable(solver) and hasattr(solver, '__qualname__'):
+        module = getattr(solver, '__module__', None) or ''
+        return f"{module}.{solver.__qualname__}@{solver_version(module)}"
+    return repr(solver)
+
+
+class ResultCache:
+    """Persistent solver results, keyed by formula hash and solver description.
+
+    Entries live in one SQLite table and record the status, verdict, the
+    full solver result (pickled, so a model or stats come back as they
+    were returned), wall and CPU time, and the timeout of the run. Once
+    more than `max_entries` are stored, the least recently used are
+    evicted. Only the process driving the workers uses the cache.
+    """
+
+    def __init__(self, path=None, max_entries=100000):
+        path = path or RESULTS_PATH
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        self.max_entries = max_entries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def key(self, solver, clauses):
+        return f"{formula_hash(clauses)}:{describe_solver(solver)}"
+
+    def get(self, key, timeout):
+        """Returns (result, wall, cpu, status) as the run would have, or None on a miss.
+
+        A solved entry answers any timeout, as a timeout if it took longer
+        than that. A timed-out entry only answers timeouts up to its own.
+        """
+        row = self.db.execute("SELECT status, result, time, cpu_time, timeout FROM results WHERE key = ?",
+                              (key,)).fetchone()
+        if row is None:
+            return None
+        status, result, wall, cpu, limit = row
+        if status == 'timeout':
+            if timeout is None or (limit is not None and timeout > limit):
+                return None
+        elif timeout is not None and wall > timeout:
+            status = 'timeout'
+        with self.db:
+            self.db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        if status == 'timeout':
+            return None, None, None, 'timeout'
+        return pickle.loads(result), wall, cpu, None
+
+    def put(self, key, result, wall, cpu, status, timeout):
+        if status not in (None, 'timeout'):
+            return  # errors are not worth remembering
+        if status == 'timeout':
+            result = wall = cpu = None
+        verdict = result[0] if isinstance(result, tuple) else result
+        with self.db:
+            self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (key, key.split(':', 1)[1], status,
+                             None if verdict is None else int(bool(verdict)),
+                             None if status else pickle.dumps(result), wall, cpu, timeout, time.time()))
+            excess = self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0] - self.max_entries
+            if excess > 0:
+                self.db.execute("DELETE FROM results WHERE key IN "
+                                "(SELECT key FROM results ORDER BY last_used LIMIT ?)", (excess,))
+
+    def close(self):
+        self.db.close()
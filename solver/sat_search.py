@@ -0,0 +1,204 @@
+from abc import ABC, abstractmethod
+from sat_heap import VarHeap
+
+
+class Brancher(ABC):
+    """Decision heuristic plugged into dpll_search (and the CDCL solver).
+
+    `pick` returns the literal to decide next, or None when there is nothing
+    left to decide, and `pure_literals` the literals whose negation no longer
+    occurs in an open clause. The hooks let incremental heuristics follow
+    the search:
+    `on_conflict` gets the falsified clause index before backtracking and
+    `on_backtrack` the literals the trail just lost.
+    """
+
+    @abstractmethod
+    def pick(self, engine):
+        pass
+
+    def pure_literals(self, engine):
+        literals = set()
+        for clause in engine.open_clauses():
+            literals.update(clause)
+        return [lit for lit in literals if -lit not in literals]
+
+    def on_conflict(self, engine, conflict):
+        pass
+
+    def on_backtrack(self, literals):
+        pass
+
+
+class ClauseScanBrancher(Brancher):
+    """Adapts a choose_literal(open_clauses) function such as choose_literal_jw."""
+
+    def __init__(self, choose_literal):
+        self.choose_literal = choose_literal
+
+    def pick(self, engine):
+        return self.choose_literal(engine.open_clauses())
+
+
+class IncrementalBrancher(Brancher):
+    """Brancher whose scores follow the engine trail literal by literal.
+
+    Subclasses implement `assigned(lit)` and its exact inverse
+    `unassigned(lit)`; `sync` replays the trail entries made since the last
+    call and `on_backtrack` reverts the synced ones the trail just lost.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.synced = 0
+
+    @abstractmethod
+    def assigned(self, literal):
+        pass
+
+    @abstractmethod
+    def unassigned(self, literal):
+        pass
+
+    def sync(self):
+        trail = self.engine.trail
+        while self.synced < len(trail):
+            self.assigned(trail[self.synced])
+            self.synced += 1
+
+    def on_backtrack(self, literals):
+        start = len(self.engine.trail)
+        if self.synced > start:
+            for lit in reversed(literals[:self.synced - start]):
+                self.unassigned(lit)
+            self.synced = start
+
+
+class CountingBrancher(IncrementalBrancher):
+    """IncrementalBrancher over literal counts of the unsatisfied clauses.
+
+    counts[lit] is the number of unsatisfied clauses containing lit. A clause
+    only changes the counts when it becomes satisfied or unsatisfied again,
+    so an assignment costs the clauses containing that literal. A literal can
+    only turn pure when the count of its negation drops to zero or its
+    variable is unassigned, and only those candidates are checked.
+
+    Literals are picked from a VarHeap over `scores`, the counts themselves
+    unless a subclass passes its own; one that does keeps them up to date
+    in `satisfied` and `unsatisfied`, which run after the counts of the
+    clause have changed.
+    """
+
+    def __init__(self, engine, scores=None):
+        super().__init__(engine)
+        size = 2 * engine.num_vars + 1
+        self.occurrences = [[] for _ in range(size)]
+        self.true_count = [0] * len(engine.clauses)
+        self.counts = [0] * size
+
+        for index, clause in enumerate(engine.clauses):
+            for lit in clause:
+                self.occurrences[lit].append(index)
+                self.counts[lit] += 1
+        literals = [lit for lit in range(-engine.num_vars, engine.num_vars + 1) if lit]
+        self.heap = VarHeap(self.counts if scores is None else scores, literals)
+        self.candidates = [lit for lit in literals if not self.counts[-lit]]
+
+    def satisfied(self, index):
+        heap = self.heap
+        for lit in self.engine.clauses[index]:
+            heap.decreased(lit)
+
+    def unsatisfied(self, index):
+        heap = self.heap
+        for lit in self.engine.clauses[index]:
+            heap.increased(lit)
+
+    def assigned(self, literal):
+        clauses = self.engine.clauses
+        true_count = self.true_count
+        counts = self.counts
+        for index in self.occurrences[literal]:
+            if not true_count[index]:
+                for lit in clauses[index]:
+                    counts[lit] -= 1
+                    if not counts[lit]:
+                        self.candidates.append(-lit)
+                self.satisfied(index)
+            true_count[index] += 1
+
+    def unassigned(self, literal):
+        clauses = self.engine.clauses
+        true_count = self.true_count
+        counts = self.counts
+        for index in self.occurrences[literal]:
+            true_count[index] -= 1
+            if not true_count[index]:
+                for lit in clauses[index]:
+                    counts[lit] += 1
+                self.unsatisfied(index)
+        self.heap.push(literal)
+        self.heap.push(-literal)
+        self.candidates.append(literal)
+        self.candidates.append(-literal)
+
+    def pure_literals(self, engine):
+        self.sync()
+        values = engine.values
+        counts = self.counts
+        pure = {lit for lit in self.candidates if not values[lit] and counts[lit] and not counts[-lit]}
+        self.candidates.clear()
+        return pure
+
+    def pick(self, engine):
+        self.sync()
+        values = engine.values
+        heap = self.heap
+        while heap and values[heap.top()]:
+            heap.pop()  # assigned literals leave lazily
+        if not heap or not self.counts[heap.top()]:
+            return None  # no open clause left
+        return heap.top()
+
+
+def dpll_search(engine, brancher, pure_literals=True, assumptions=()):
+    """DPLL over a shared Propagator, driven by an explicit decision stack.
+
+    `brancher` is a Brancher, or a plain function that receives the open
+    clauses (see Propagator.open_clauses) and returns the literal to try
+    first, or None when no clause is open. Every stack entry is the literal
+    decided at that level and whether it is already the second branch, so
+    the search never recurses. Pure literal elimination runs at every node
+    unless `pure_literals` is False. `assumptions` are assigned at the root
+    before the search starts, so False then means no model extends them.
+    """
+    if not isinstance(brancher, Brancher):
+        brancher = ClauseScanBrancher(brancher)
+    for lit in assumptions:
+        if not engine.assign(lit):
+            return False
+
+    decisions = []
+    while True:
+        conflict = engine.propagate()
+        if conflict is None:
+            if pure_literals:
+                for lit in brancher.pure_literals(engine):
+                    engine.assign(lit)
+            literal = brancher.pick(engine)
+            if literal is None:
+                return True  # every clause satisfied
+            decisions.append((literal, False))
+            engine.decide(literal)
+            continue
+
+        # Conflict: drop exhausted levels, then flip the deepest untried branch
+        brancher.on_conflict(engine, conflict)
+        while decisions and decisions[-1][1]:
+            decisions.pop()
+        if not decisions:
+            return False
+        literal, _ = decisions.pop()
+        brancher.on_backtrack(engine.backtrack(len(decisions)))
+        decisions.append((-literal, True))
+        engine.decide(-literal)
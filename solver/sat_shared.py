@@ -0,0 +1,78 @@
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from sat_clausedb import ClauseStore
+
+
+class SharedClauses:
+    """A ClauseStore copied once into a shared memory segment.
+
+    The segment holds the literal buffer followed by the offsets, both as
+    int32. Pickling a SharedClauses only sends the segment name and the
+    sizes; a worker calls `attach` to get a ClauseStore whose buffers are
+    views straight into the segment, so the clauses are neither serialized
+    nor duplicated per worker. The process that created the segment owns it
+    and must `unlink` it once no task needs it any more.
+    """
+
+    def __init__(self, store):
+        literals, offsets = store.literals, store.offsets
+        self.num_literals = len(literals)
+        self.num_offsets = len(offsets)
+        self.num_vars = store.num_vars
+        self.memory = shared_memory.SharedMemory(create=True, size=4 * (self.num_literals + self.num_offsets))
+        self.name = self.memory.name
+        self.views = ()
+        view = self.memory.buf.cast('i')
+        view[:self.num_literals] = literals
+        view[self.num_literals:self.num_literals + self.num_offsets] = offsets
+        view.release()
+
+    def __getstate__(self):
+        return {
+            'name': self.name,
+            'num_literals': self.num_literals,
+            'num_offsets': self.num_offsets,
+            'num_vars': self.num_vars
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.memory = None
+        self.views = ()
+
+    def attach(self):
+        """Maps the segment by name and returns a ClauseStore over it."""
+        try:
+            self.memory = shared_memory.SharedMemory(name=self.name, track=False)
+        except TypeError:  # Python < 3.13 always registers with the tracker
+            self.memory = shared_memory.SharedMemory(name=self.name)
+        view = self.memory.buf.cast('i')
+        literals = view[:self.num_literals]
+        offsets = view[self.num_literals:self.num_literals + self.num_offsets]
+        self.views = (literals, offsets, view)
+        return ClauseStore(literals, offsets, self.num_vars)
+
+    def detach(self):
+        for view in self.views:
+            view.release()
+        self.views = ()
+        try:
+            self.memory.close()
+        except BufferError:
+            pass  # a solver still holds a slice; the mapping goes with the process
+
+    def unlink(self):
+        self.memory.close()
+        self.memory.unlink()
+
+
+@contextmanager
+def attached(clauses):
+    """Yields the ClauseStore behind a SharedClauses, or any other clauses as is."""
+    if not isinstance(clauses, SharedClauses):
+        yield clauses
+        return
+    try:
+        yield clauses.attach()
+    finally:
+        clauses.detach()
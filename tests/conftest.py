@@ -0,0 +1,13 @@
+import os
+import sys
+import pytest
+
+# The solver modules import each other by their flat names
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'solver'))
+
+
+@pytest.fixture(autouse=True)
+def parse_cache(tmp_path_factory, monkeypatch):
+    """Keeps parsed instances cached by the code under test out of the user's cache."""
+    import sat_cache
+    monkeypatch.setattr(sat_cache, 'CACHE_DIR', str(tmp_path_factory.getbasetemp() / 'cnf-cache'))
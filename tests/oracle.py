@@ -0,0 +1,35 @@
+import random
+from itertools import product
+
+
+def random_cnf(seed, num_vars=None, num_clauses=None, max_len=3):
+    """A small random CNF as a list of tuples; includes units and duplicate literals now and then."""
+    rng = random.Random(seed)
+    num_vars = num_vars or rng.randint(1, 8)
+    num_clauses = num_clauses or rng.randint(1, 5 * num_vars)
+    clauses = []
+    for _ in range(num_clauses):
+        size = rng.randint(1, max_len)
+        clauses.append(tuple(rng.choice((-1, 1)) * rng.randint(1, num_vars) for _ in range(size)))
+    return clauses
+
+
+def random_ksat(seed, num_vars, num_clauses, k=3):
+    """Uniform random k-SAT: k distinct variables per clause, hard near 4.26 clauses per variable."""
+    rng = random.Random(seed)
+    return [tuple(rng.choice((-1, 1)) * var for var in rng.sample(range(1, num_vars + 1), k))
+            for _ in range(num_clauses)]
+
+
+def satisfies(model, clauses):
+    true = set(model)
+    return all(any(lit in true for lit in clause) for clause in clauses)
+
+
+def brute_force(clauses):
+    """True if some assignment of the variables in clauses satisfies them all."""
+    variables = sorted({abs(lit) for clause in clauses for lit in clause})
+    for values in product((1, -1), repeat=len(variables)):
+        if satisfies([sign * var for sign, var in zip(values, variables)], clauses):
+            return True
+    return False
@@ -0,0 +1,124 @@
+import os
+import pytest
+import sat_cache
+from sat_cache import read_dimacs_cached, cache_path, load_store, save_store
+from sat_clausedb import ClauseStore
+
+DATA = "p cnf 3 2\n1 -2 0\n2 3 0\n"
+
+
+@pytest.fixture
+def instance(tmp_path):
+    path = tmp_path / "instance.cnf"
+    path.write_text(DATA)
+    return str(path)
+
+
+def test_cached_store_round_trips(instance, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    first = read_dimacs_cached(instance, cache_dir)
+    assert first[2].mapping is None  # parsed, then saved
+    num_vars, num_clauses, store = read_dimacs_cached(instance, cache_dir)
+    with store:
+        assert store.mapping is not None
+        assert (num_vars, num_clauses, list(store)) == (first[0], first[1], list(first[2]))
+    assert store.mapping is None
+
+
+def test_unchanged_file_is_not_hashed_again(instance, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    path = cache_path(instance, cache_dir)
+    monkeypatch.setattr(sat_cache, 'content_hash', lambda file_path: pytest.fail("file was hashed again"))
+    assert cache_path(instance, cache_dir) == path
+
+
+def test_edited_file_gets_a_new_entry(instance, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    read_dimacs_cached(instance, cache_dir)
+    with open(instance, 'a') as f:
+        f.write("-1 -3 0\n")
+    _, _, store = read_dimacs_cached(instance, cache_dir)
+    assert list(store)[-1] == (-1, -3)
+
+
+def test_touched_file_keeps_its_entry(instance, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    path = cache_path(instance, cache_dir)
+    stat = os.stat(instance)
+    os.utime(instance, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache_path(instance, cache_dir) == path
+
+
+def test_parser_version_is_part_of_the_key(instance, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    path = cache_path(instance, cache_dir)
+    monkeypatch.setattr(sat_cache, 'solver_version', lambda module_name: 'edited')
+    assert cache_path(instance, cache_dir) != path
+
+
+@pytest.mark.parametrize('payload', [b'', b'CNFB', b'XXXX' + bytes(60)])
+def test_invalid_entries_are_ignored(tmp_path, payload):
+    path = tmp_path / "entry.cnfb"
+    path.write_bytes(payload)
+    assert load_store(str(path)) is None
+    os.remove(path)  # nothing keeps it mapped
+
+
+def test_truncated_entry_is_ignored(tmp_path):
+    path = str(tmp_path / "entry.cnfb")
+    save_store(path, 3, 2, ClauseStore.from_clauses([(1, -2), (2, 3)]))
+    with open(path, 'r+b') as f:
+        f.truncate(os.path.getsize(path) - 4)
+    assert load_store(path) is None
+
+
+def test_mapped_store_pickles_as_arrays(instance, tmp_path):
+    import pickle
+    cache_dir = str(tmp_path / "cache")
+    read_dimacs_cached(instance, cache_dir)
+    with read_dimacs_cached(instance, cache_dir)[2] as store:
+        copy = pickle.loads(pickle.dumps(store))
+    assert copy.mapping is None and list(copy) == [(1, -2), (2, 3)]
+
+
+def entries(cache_dir):
+    return sorted(name for name in os.listdir(cache_dir) if name.endswith('.cnfb'))
+
+
+def test_edits_and_touches_do_not_grow_the_cache(instance, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    read_dimacs_cached(instance, cache_dir)
+    for step in range(3):
+        stat = os.stat(instance)
+        os.utime(instance, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        read_dimacs_cached(instance, cache_dir)
+        with open(instance, 'a') as f:
+            f.write(f"{step + 1} 0\n")
+        read_dimacs_cached(instance, cache_dir)
+    assert len(entries(cache_dir)) == 1
+    assert len(os.listdir(os.path.join(cache_dir, 'refs'))) == 1
+    assert entries(cache_dir)[0] == os.path.basename(cache_path(instance, cache_dir))
+
+
+def test_new_parser_replaces_old_entries(instance, tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / "cache")
+    read_dimacs_cached(instance, cache_dir)
+    monkeypatch.setattr(sat_cache, 'solver_version', lambda module_name: 'edited')
+    read_dimacs_cached(instance, cache_dir)
+    assert entries(cache_dir) == [os.path.basename(cache_path(instance, cache_dir))]
+
+
+def test_cache_keeps_the_most_recently_used_entries(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    paths = []
+    for var in range(1, 5):
+        path = tmp_path / f"unit{var}.cnf"
+        path.write_text(f"p cnf {var} 1\n{var} 0\n")
+        paths.append(str(path))
+    for path in paths[:3]:
+        read_dimacs_cached(path, cache_dir, max_entries=3)
+    kept = cache_path(paths[0], cache_dir)
+    os.utime(cache_path(paths[1], cache_dir), ns=(0, 0))  # long unused
+    read_dimacs_cached(paths[3], cache_dir, max_entries=3)
+    assert len(entries(cache_dir)) == 3 and len(os.listdir(os.path.join(cache_dir, 'refs'))) <= 3
+    assert os.path.exists(kept) and not os.path.exists(cache_path(paths[1], cache_dir))
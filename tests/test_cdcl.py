@@ -0,0 +1,111 @@
+import pytest
+from itertools import combinations
+import functools
+from oracle import random_cnf, random_ksat, brute_force
+from sat_cdcl import cdcl, cdcl_with_stats, luby, CDCLSolver, RESTART_POLICIES
+from sat_pool import benchmark_folders
+from benchmark_cdcl import count_deleted
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_cdcl_matches_brute_force(seed):
+    clauses = random_cnf(seed)
+    assert cdcl(clauses) == brute_force(clauses)
+
+
+@functools.lru_cache(maxsize=None)
+def ksat_verdict(seed):
+    return brute_force(random_ksat(seed, 12, 51))
+
+
+@pytest.mark.parametrize('seed', range(100))
+@pytest.mark.parametrize('restarts', RESTART_POLICIES)
+@pytest.mark.parametrize('phase_saving', [True, False])
+def test_restart_policies_match_brute_force(seed, restarts, phase_saving):
+    clauses = random_ksat(seed, 12, 51)
+    solver = CDCLSolver(clauses, restarts=restarts, restart_base=1, lbd_window=2, phase_saving=phase_saving)
+    assert solver.solve() == ksat_verdict(seed)
+
+
+def test_luby_sequence():
+    assert [luby(i) for i in range(1, 16)] == [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8]
+
+
+def test_unknown_restart_policy_is_rejected():
+    with pytest.raises(ValueError):
+        CDCLSolver([(1,)], restarts='never')
+
+
+@pytest.mark.parametrize('seed', range(40))
+def test_learned_clauses_are_implied(seed):
+    clauses = random_cnf(seed, num_vars=10, num_clauses=42)
+    solver = CDCLSolver(clauses)
+    solver.solve()
+    for index in solver.learned:
+        learned = solver.engine.clauses[index]
+        if learned is not None:
+            assert not brute_force(clauses + [(-lit,) for lit in learned])
+
+
+def pigeonhole(pigeons, holes):
+    """Every pigeon in a hole, no two sharing one: satisfiable iff pigeons <= holes."""
+    var = lambda pigeon, hole: pigeon * holes + hole + 1
+    clauses = [tuple(var(p, h) for h in range(holes)) for p in range(pigeons)]
+    for h in range(holes):
+        for p, q in combinations(range(pigeons), 2):
+            clauses.append((-var(p, h), -var(q, h)))
+    return clauses
+
+
+@pytest.mark.parametrize('holes', range(2, 7))
+@pytest.mark.parametrize('extra', [0, 1])
+def test_reduction_keeps_cdcl_sound(holes, extra):
+    solver = CDCLSolver(pigeonhole(holes + extra, holes), reduce_interval=10, reduce_increment=1, glue_lbd=1)
+    assert solver.solve() == (not extra)
+    for index in solver.learned:
+        assert solver.engine.clauses[index] is not None
+
+
+def test_reduction_deletes_learned_clauses():
+    solver = CDCLSolver(pigeonhole(7, 6), reduce_interval=10, reduce_increment=1, glue_lbd=1)
+    assert solver.solve() is False
+    assert solver.reductions and solver.deleted_clauses
+
+
+@pytest.mark.parametrize('restarts', RESTART_POLICIES)
+@pytest.mark.parametrize('phase_saving', [True, False])
+def test_restarts_happen_and_keep_cdcl_sound(restarts, phase_saving):
+    for pigeons in (5, 6):
+        solver = CDCLSolver(pigeonhole(pigeons, 5), restarts=restarts, restart_base=2, lbd_window=5,
+                            phase_saving=phase_saving)
+        assert solver.solve() == (pigeons == 5)
+        if pigeons == 6:
+            assert bool(solver.restart_count) == (restarts is not None)
+
+
+def test_phase_saving_remembers_the_last_polarity():
+    saved = CDCLSolver(pigeonhole(6, 5), restart_base=2, phase_saving=True)
+    saved.solve()
+    assert any(phase > 0 for phase in saved.brancher.phase[1:])
+    plain = CDCLSolver(pigeonhole(6, 5), restart_base=2, phase_saving=False)
+    plain.solve()
+    assert all(phase < 0 for phase in plain.brancher.phase[1:])
+
+
+def test_cdcl_passes_reduction_settings_on():
+    is_sat, stats = cdcl_with_stats(pigeonhole(7, 6), reduce_interval=10, reduce_increment=1, glue_lbd=1)
+    assert is_sat is False
+    assert stats['reductions'] and stats['deleted_clauses']
+    assert cdcl_with_stats(pigeonhole(7, 6), reduce_interval=10 ** 9)[1]['deleted_clauses'] == 0
+    assert cdcl(pigeonhole(7, 6), reduce_interval=10, reduce_fraction=1.0, glue_lbd=1) is False
+
+
+def test_benchmark_reports_deleted_clauses(tmp_path):
+    for pigeons in (6, 7):
+        clauses = pigeonhole(pigeons, 6)
+        lines = [f"p cnf {pigeons * 6} {len(clauses)}"] + [" ".join(map(str, clause)) + " 0" for clause in clauses]
+        (tmp_path / f"php{pigeons}.cnf").write_text("\n".join(lines) + "\n")
+    solver = functools.partial(cdcl_with_stats, reduce_interval=10, reduce_increment=1, glue_lbd=1)
+    stats = benchmark_folders(solver, [str(tmp_path)], 60, workers=1, counters={"clauses_deleted": count_deleted})
+    assert stats[str(tmp_path)]['files_processed'] == 2
+    assert stats[str(tmp_path)]['clauses_deleted'] > 0
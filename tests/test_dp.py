@@ -0,0 +1,62 @@
+import pytest
+from oracle import random_cnf, random_ksat, brute_force
+from sat_dp import dp_algorithm, dp_with_stats, signature, merge_resolvents, OccurrenceIndex
+from resolution_module import resolution_algorithm, resolution_with_stats, clause_to_mask, mask_literals, resolve, subsumes
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_dp_matches_brute_force(seed):
+    clauses = random_cnf(seed)
+    assert dp_algorithm(clauses) == brute_force(clauses)
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_resolution_matches_brute_force(seed):
+    clauses = random_cnf(seed)
+    assert resolution_algorithm(clauses) == brute_force(clauses)
+
+
+@pytest.mark.parametrize('with_stats', [dp_with_stats, resolution_with_stats])
+def test_subsumption_is_counted(with_stats):
+    # Random 3-SAT at this density makes both procedures subsume both ways
+    clauses = random_ksat(0, 8, 34)
+    is_sat, stats = with_stats(clauses)
+    assert is_sat == brute_force(clauses)
+    assert stats['forward_subsumed'] > 0 and stats['backward_subsumed'] > 0
+
+
+@pytest.mark.parametrize('seed', range(30))
+@pytest.mark.parametrize('with_stats', [dp_with_stats, resolution_with_stats])
+def test_subsumption_keeps_verdicts(seed, with_stats):
+    clauses = random_ksat(seed, 8, 34)
+    assert with_stats(clauses)[0] == brute_force(clauses)
+
+
+@pytest.mark.parametrize('seed', range(100))
+def test_signature_never_rejects_a_subset(seed):
+    clauses = random_cnf(seed, num_vars=100, num_clauses=20, max_len=6)
+    for a in clauses:
+        for b in clauses:
+            if set(a) <= set(b):
+                assert not signature(a) & ~signature(b)
+
+
+def test_merge_resolvents_subsumes_both_ways():
+    index = OccurrenceIndex([frozenset({1, 2, 3}), frozenset({4, 5})], 5)
+    stats = {}
+    assert merge_resolvents(index, [frozenset({1, 2}), frozenset({4, 5, 6})], stats)
+    assert sorted(map(sorted, index.clauses.values())) == [[1, 2], [4, 5]]
+    assert stats == {'forward_subsumed': 1, 'backward_subsumed': 1}
+
+
+def test_merge_resolvents_reports_the_empty_clause():
+    index = OccurrenceIndex([frozenset({1})], 1)
+    assert merge_resolvents(index, [frozenset()]) is False
+
+
+def test_masks_round_trip_and_resolve():
+    a, b = clause_to_mask((1, -2, 3)), clause_to_mask((2, 4))
+    assert sorted(mask_literals(a)) == [-2, 1, 3]
+    assert sorted(mask_literals(resolve(a, b))) == [1, 3, 4]
+    assert resolve(a, clause_to_mask((-1, 2))) is None  # clashes on two variables
+    assert subsumes(clause_to_mask((1, 3)), a) and not subsumes(a, clause_to_mask((1, 3)))
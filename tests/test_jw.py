@@ -0,0 +1,61 @@
+import pytest
+from oracle import random_cnf, brute_force
+from sat_propagation import Propagator
+from sat_search import dpll_search
+from sat_dpll_jw import dpll_jw, JeroslowWang, choose_literal_jw
+from sat_dpll_most_freq import dpll as dpll_mf, MostFrequent
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_dpll_jw_matches_brute_force(seed):
+    clauses = random_cnf(seed)
+    assert dpll_jw(clauses) == brute_force(clauses)
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_dpll_mf_matches_brute_force(seed):
+    clauses = random_cnf(seed)
+    assert dpll_mf(clauses) == brute_force(clauses)
+
+
+@pytest.mark.parametrize('brancher', [JeroslowWang, MostFrequent])
+def test_incremental_branchers_never_scan_open_clauses(brancher, monkeypatch):
+    calls = []
+    scan = Propagator.open_clauses
+
+    def counted(engine):
+        calls.append(1)
+        return scan(engine)
+
+    monkeypatch.setattr(Propagator, 'open_clauses', counted)
+    for seed in range(50):
+        clauses = random_cnf(seed, num_vars=12, num_clauses=50)
+        engine = Propagator(clauses)
+        assert dpll_search(engine, brancher(engine)) == brute_force(clauses)
+    assert not calls
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_jw_scores_follow_the_trail(seed):
+    clauses = random_cnf(seed, num_vars=10, num_clauses=30, max_len=4)
+    engine = Propagator(clauses)
+    brancher = JeroslowWang(engine)
+    for lit in (1, -2, 3):
+        if not engine.value(lit):
+            engine.decide(lit)
+            if engine.propagate() is not None:
+                return  # open_clauses is not meaningful after a conflict
+    brancher.sync()
+    open_clauses = list(engine.open_clauses())
+    if [] in open_clauses:
+        return  # refuted at the root
+    literal = brancher.pick(engine)
+    if not open_clauses:
+        assert literal is None
+    else:
+        expected = choose_literal_jw(open_clauses)
+        scores = {}
+        for clause in open_clauses:
+            for lit in clause:
+                scores[lit] = scores.get(lit, 0) + 2 ** -len(clause)
+        assert scores[literal] == scores[expected]
@@ -0,0 +1,58 @@
+import time
+import pytest
+from oracle import random_cnf, brute_force
+from sat_pool import SolverPool, Scheduler
+from sat_clausedb import ClauseStore
+from sat_dpll import dpll
+
+
+def stall(clauses):
+    time.sleep(60)
+
+
+@pytest.fixture(scope='module')
+def pool():
+    with SolverPool() as pool:
+        yield pool
+
+
+def test_pool_solves_lists_and_stores(pool):
+    for seed in range(10):
+        clauses = random_cnf(seed)
+        for given in (clauses, ClauseStore.from_clauses(clauses)):
+            result, elapsed, status = pool.run(dpll, given, timeout=30)
+            assert status is None and elapsed >= 0
+            assert result == brute_force(clauses)
+
+
+def test_timeout_recycles_a_ready_worker(pool):
+    result, elapsed, status = pool.run(stall, [(1,)], timeout=0.2)
+    assert (result, elapsed, status) == (None, None, 'timeout')
+    assert pool.pool is not None and not pool.warmed  # replacement already spawned
+    # Start-up and imports of the replacement are not charged to this run
+    result, elapsed, status = pool.run(dpll, [(1, 2), (-1,)], timeout=0.1)
+    assert status is None and result is True
+
+
+def fail(clauses):
+    raise ValueError("no luck")
+
+
+def test_scheduler_runs_every_task():
+    seeds = range(12)
+    stores = {seed: ClauseStore.from_clauses(random_cnf(seed)) for seed in seeds}
+    tasks = [(seed, dpll, stores[seed], 30) for seed in seeds]
+    tasks += [('stall', stall, stores[0], 0.2), ('fail', fail, stores[1], None)]
+    with Scheduler(2) as scheduler:
+        outcomes = {key: (result, status) for key, result, _, _, status in scheduler.run(tasks)}
+        assert not scheduler.shared and not scheduler.busy  # every segment released
+    assert outcomes.pop('stall') == (None, 'timeout')
+    assert outcomes.pop('fail') == ("ValueError: no luck", 'error')
+    assert outcomes == {seed: (brute_force(list(stores[seed])), None) for seed in seeds}
+
+
+def test_scheduler_deadline_starts_with_the_solve():
+    # The fresh worker still has to spawn and import the solver: that must not count
+    with Scheduler(1) as scheduler:
+        [(_, result, _, _, status)] = scheduler.run([(0, dpll, [(1, 2), (-1,)], 0.1)])
+    assert status is None and result is True
@@ -0,0 +1,45 @@
+import pytest
+from oracle import random_cnf, brute_force
+from test_pool import stall
+from sat_pool import Scheduler
+from sat_portfolio import portfolio
+from sat_cube import cube_and_conquer, make_cubes
+from sat_clausedb import ClauseStore
+from sat_dpll import dpll
+
+
+def test_portfolio_reuses_its_scheduler():
+    solvers = {'DPLL': dpll, 'stall': stall}
+    with Scheduler(len(solvers)) as scheduler:
+        for seed in range(6):
+            clauses = ClauseStore.from_clauses(random_cnf(seed))
+            is_sat, winner, elapsed = portfolio(clauses, solvers, timeout=30, scheduler=scheduler)
+            assert (is_sat, winner) == (brute_force(list(clauses)), 'DPLL') and elapsed >= 0
+            # The stalled loser was replaced, the winner's worker kept
+            assert not scheduler.busy and not scheduler.shared
+            assert len(scheduler.idle) == len(solvers)
+        kept = {process.pid for process, _ in scheduler.idle}
+        portfolio([(1,)], {'DPLL': dpll}, scheduler=scheduler)
+        assert {process.pid for process, _ in scheduler.idle} == kept
+
+
+def test_portfolio_reports_when_no_solver_answers():
+    assert portfolio([(1,)], {'stall': stall}, timeout=0.2) == (None, None, None)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_cube_and_conquer_matches_brute_force(seed):
+    clauses = random_cnf(seed, num_vars=12, num_clauses=50)
+    with Scheduler(2) as scheduler:
+        assert cube_and_conquer(clauses, depth=3, timeout=30, scheduler=scheduler) == brute_force(clauses)
+        assert not scheduler.busy and not scheduler.shared
+
+
+@pytest.mark.parametrize('seed', range(50))
+def test_cubes_cover_the_formula(seed):
+    clauses = random_cnf(seed, num_vars=10, num_clauses=40)
+    status, cubes = make_cubes(clauses, 2)
+    if status is not None:
+        assert status == brute_force(clauses)
+    else:
+        assert any(brute_force(clauses + [(lit,) for lit in cube]) for cube in cubes) == brute_force(clauses)
@@ -0,0 +1,64 @@
+import pytest
+from oracle import random_cnf, brute_force, satisfies
+from sat_preprocess import Preprocessor, with_preprocessing
+from sat_dpll import dpll
+from sat_dpll_jw import dpll_jw
+from sat_dpll_most_freq import dpll as dpll_mf
+from sat_dpll_vsids import dpll_vsids
+from sat_cdcl import cdcl
+from sat_dp import dp_algorithm
+
+SOLVERS = [dpll, dpll_jw, dpll_mf, dpll_vsids, cdcl]
+
+
+@pytest.mark.parametrize('seed', range(200))
+def test_simplified_formula_is_equisatisfiable(seed):
+    clauses = random_cnf(seed, max_len=4)
+    simplified = Preprocessor(clauses, growth=2).simplify()
+    expected = brute_force(clauses)
+    if simplified is None:
+        assert not expected
+    else:
+        assert brute_force(list(simplified)) == expected
+
+
+@pytest.mark.parametrize('seed', range(200))
+@pytest.mark.parametrize('solver', SOLVERS, ids=lambda solver: solver.__module__)
+def test_extended_model_satisfies_original(seed, solver):
+    clauses = random_cnf(seed, max_len=4)
+    is_sat, model = with_preprocessing(solver, model=True)(clauses)
+    assert is_sat == brute_force(clauses)
+    if is_sat:
+        assert satisfies(model, clauses)
+    else:
+        assert model is None
+
+
+@pytest.mark.parametrize('seed', range(100))
+def test_preprocessing_without_model_passes_the_verdict_through(seed):
+    clauses = random_cnf(seed)
+    assert with_preprocessing(dp_algorithm)(clauses) == brute_force(clauses)
+
+
+@pytest.mark.parametrize('solver', SOLVERS, ids=lambda solver: solver.__module__)
+def test_solvers_return_models(solver):
+    clauses = [(1, 2), (-1, 3), (-3, -2), (2, 4)]
+    is_sat, model = solver(clauses, model=True)
+    assert is_sat and satisfies(model, clauses)
+    assert solver([(1,), (-1,)], model=True) == (False, None)
+
+
+def test_extend_restores_eliminated_variables():
+    clauses = [(1, 2), (-1, 3), (-2, -3), (3, 4), (-4, 5)]
+    preprocessor = Preprocessor(clauses, growth=4)
+    simplified = preprocessor.simplify()
+    assert preprocessor.stack
+    is_sat, model = dpll(simplified, model=True)
+    assert is_sat
+    assert satisfies(preprocessor.extend(model), clauses)
+
+
+def test_preprocessor_does_not_queue_units():
+    preprocessor = Preprocessor([(1,), (-1, 2), (2, 3, 4), (-4, 5)] + [(i, i + 1) for i in range(6, 30)])
+    preprocessor.simplify()
+    assert not preprocessor.index.units
@@ -0,0 +1,51 @@
+import pytest
+from oracle import random_cnf, brute_force
+from sat_propagation import Propagator
+from sat_dpll import dpll
+
+
+def test_units_propagate_to_a_fixpoint():
+    engine = Propagator([(1,), (-1, 2), (-2, 3), (-3, -4, 5)])
+    assert engine.propagate() is None
+    assert engine.trail == [1, 2, 3]
+    assert engine.value(4) == 0 and engine.value(-1) == -1
+
+
+def test_conflict_and_backtrack_restore_values():
+    engine = Propagator([(-1, 2), (-1, -2), (1, 3)])
+    assert engine.propagate() is None
+    engine.decide(1)
+    assert engine.propagate() is not None
+    assert engine.backtrack(0) == [1, 2]
+    assert engine.trail == [] and engine.value(2) == 0
+    engine.decide(-1)
+    assert engine.propagate() is None
+    assert engine.trail == [-1, 3]
+
+
+def test_empty_clause_is_a_root_conflict():
+    assert Propagator([(1, 2), ()]).propagate() is not None
+
+
+def test_open_clauses_hides_satisfied_clauses_and_false_literals():
+    engine = Propagator([(1, 2), (-1, 3, 4), (2, 3)])
+    engine.decide(1)
+    engine.propagate()
+    assert sorted(map(sorted, engine.open_clauses())) == [[2, 3], [3, 4]]
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_dpll_matches_brute_force(seed):
+    clauses = random_cnf(seed)
+    assert dpll(clauses) == brute_force(clauses)
+
+
+@pytest.mark.parametrize('seed', range(100))
+def test_root_propagation_only_derives_implied_literals(seed):
+    clauses = random_cnf(seed)
+    engine = Propagator(clauses)
+    if engine.propagate() is not None:
+        assert not brute_force(clauses)
+    else:
+        for lit in engine.trail:
+            assert not brute_force(clauses + [(-lit,)])
@@ -0,0 +1,85 @@
+import bz2
+import gzip
+import lzma
+import pytest
+import sat_reader
+from sat_reader import parse_dimacs, stream_dimacs, stream_store, read_dimacs_store, read_dimacs_cnf
+
+CASES = {
+    'plain': (b"p cnf 3 2\n1 -2 0\n2 3 0\n", (3, 2, [(1, -2), (2, 3)])),
+    'bare zero line': (b"p cnf 3 2\n1 -2 0\n0\n2 3 0\n", (3, 2, [(1, -2), (2, 3)])),
+    'double zero': (b"p cnf 2 1\n1 2 0 0\n0 0\n", (2, 1, [(1, 2)])),
+    'spanning lines': (b"p cnf 4 2\n1 -2\n3 0 -4\n2 0\n", (4, 2, [(1, -2, 3), (-4, 2)])),
+    'percent trailer': (b"p cnf 2 2\n1 0\n-1 2 0\n%\n0\n\n", (2, 2, [(1,), (-1, 2)])),
+    'comments': (b"c first\np cnf 2 1\nc inside\n1 2 0\nc last", (2, 1, [(1, 2)])),
+    'no header': (b"1 -5 0\n2 0\n", (5, 2, [(1, -5), (2,)])),
+    'unterminated': (b"p cnf 2 2\n1 0\n-2", (2, 2, [(1,), (-2,)])),
+    'empty': (b"p cnf 0 0\n", (0, 0, [])),
+    'indented comment': (b"p cnf 3 2\n1 -2 0\n   c indented\n\tc tabbed\n3 0\n", (3, 2, [(1, -2), (3,)])),
+    'literal out of range': (b"p cnf 2 1\n1 99999999999 0\n", ValueError),
+    'negative out of range': (b"p cnf 2 1\n-2147483648 0\n", ValueError),
+    'int32 limit': (b"p cnf 2147483647 1\n-2147483647 2147483647 0\n",
+                    (2147483647, 1, [(-2147483647, 2147483647)])),
+}
+
+
+def check(parse, data, expected):
+    if expected is ValueError:
+        with pytest.raises(ValueError):
+            parse(data)
+    else:
+        assert unpack(parse(data)) == expected
+
+
+def unpack(parsed):
+    num_vars, num_clauses, store = parsed
+    return num_vars, num_clauses, list(store)
+
+
+@pytest.fixture(params=['numpy', 'python'])
+def branch(request, monkeypatch):
+    if request.param == 'numpy':
+        if sat_reader.np is None:
+            pytest.skip("NumPy is not installed")
+    else:
+        monkeypatch.setattr(sat_reader, 'np', None)
+    return request.param
+
+
+@pytest.mark.parametrize('name', CASES)
+def test_parse_dimacs(name, branch):
+    data, expected = CASES[name]
+    check(parse_dimacs, data, expected)
+
+
+@pytest.mark.parametrize('name', CASES)
+def test_stream_store_matches_parse_dimacs(name):
+    data, expected = CASES[name]
+    check(stream_store, data.splitlines(keepends=True), expected)
+
+
+def test_stream_dimacs_skips_empty_clauses():
+    assert list(stream_dimacs(["0", "1 2 0 0", "3"])) == [(1, 2), (3,)]
+
+
+@pytest.mark.parametrize('suffix, opener', [('', open), ('.gz', gzip.open), ('.bz2', bz2.open), ('.xz', lzma.open)])
+def test_read_compressed(tmp_path, branch, suffix, opener):
+    data, expected = CASES['spanning lines']
+    path = tmp_path / f"instance.cnf{suffix}"
+    with opener(path, 'wb') as f:
+        f.write(data)
+    assert sat_reader.is_cnf_file(path.name)
+    assert unpack(read_dimacs_store(str(path))) == expected
+    assert read_dimacs_cnf(str(path))[2] == [frozenset(clause) for clause in expected[2]]
+
+
+def test_compressed_input_is_streamed(tmp_path, monkeypatch):
+    path = tmp_path / "instance.cnf.gz"
+    with gzip.open(path, 'wb') as f:
+        f.write(CASES['bare zero line'][0])
+
+    def whole(data):
+        raise AssertionError("compressed input was read whole")
+
+    monkeypatch.setattr(sat_reader, 'parse_dimacs', whole)
+    assert unpack(read_dimacs_store(str(path))) == CASES['bare zero line'][1]
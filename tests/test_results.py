@@ -0,0 +1,58 @@
+import functools
+import pytest
+from sat_results import ResultCache, formula_hash, describe_solver
+from sat_dpll import dpll
+from sat_cdcl import cdcl
+
+
+@pytest.fixture
+def cache(tmp_path):
+    with ResultCache(str(tmp_path / "results.sqlite"), max_entries=3) as cache:
+        yield cache
+
+
+def test_formula_hash_is_canonical():
+    base = formula_hash([(1, -2), (3,)])
+    assert formula_hash([(3,), (-2, 1)]) == base
+    assert formula_hash([(1, -2, 1), (3,), (3,)]) == base
+    assert formula_hash([(1, 2), (3,)]) != base
+    assert formula_hash([(1,), (-2, 3)]) != base
+
+
+def test_describe_solver_includes_configuration():
+    luby = describe_solver(functools.partial(cdcl, restarts='luby'))
+    assert "restarts='luby'" in luby and luby != describe_solver(cdcl)
+    assert describe_solver(dpll).startswith('sat_dpll.dpll@')
+
+
+def test_solved_entries_answer_any_timeout(cache):
+    key = cache.key(dpll, [(1,)])
+    assert cache.get(key, 10) is None
+    cache.put(key, (True, [1]), 2.0, 1.5, None, 10)
+    assert cache.get(key, None) == ((True, [1]), 2.0, 1.5, None)
+    assert cache.get(key, 5) == ((True, [1]), 2.0, 1.5, None)
+    assert cache.get(key, 1) == (None, None, None, 'timeout')  # took longer than that
+
+
+def test_timeouts_only_answer_shorter_timeouts(cache):
+    key = cache.key(dpll, [(1,)])
+    cache.put(key, None, None, None, 'timeout', 10)
+    assert cache.get(key, 5) == (None, None, None, 'timeout')
+    assert cache.get(key, 20) is None
+    assert cache.get(key, None) is None
+
+
+def test_errors_are_not_stored(cache):
+    key = cache.key(dpll, [(1,)])
+    cache.put(key, "ValueError: no luck", None, None, 'error', 10)
+    assert cache.get(key, 10) is None
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    keys = [cache.key(dpll, [(var,)]) for var in range(1, 5)]
+    for key in keys[:3]:
+        cache.put(key, True, 0.1, 0.1, None, 10)
+    cache.get(keys[0], 10)  # keys[1] is now the least recently used
+    cache.put(keys[3], True, 0.1, 0.1, None, 10)
+    assert cache.get(keys[1], 10) is None
+    assert all(cache.get(key, 10) is not None for key in (keys[0], keys[2], keys[3]))
@@ -0,0 +1,33 @@
+import pytest
+from oracle import random_cnf, brute_force
+from sat_dpll_vsids import dpll_vsids, VSIDS
+from sat_search import Brancher, IncrementalBrancher
+
+
+@pytest.mark.parametrize('seed', range(300))
+def test_dpll_vsids_matches_brute_force(seed):
+    clauses = random_cnf(seed)
+    assert dpll_vsids(clauses) == brute_force(clauses)
+
+
+def test_vsids_heap_pops_the_most_active_variable():
+    brancher = VSIDS(4)
+    brancher.bump(3)
+    brancher.bump(3)
+    brancher.bump(2)
+    assert brancher.heap.pop() == 3
+    assert brancher.heap.pop() == 2
+
+
+def test_brancher_without_overrides_cannot_be_built():
+    class NoPick(Brancher):
+        pass
+
+    class NoHooks(IncrementalBrancher):
+        def pick(self, engine):
+            return None
+
+    with pytest.raises(TypeError):
+        NoPick()
+    with pytest.raises(TypeError):
+        NoHooks(None)